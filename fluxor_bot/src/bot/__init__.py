@@ -2,14 +2,36 @@ import asyncio
 import logging
 from datetime import datetime
 
+from eth_account import Account
+
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.web3_utils import create_web3_provider
+from shared.utils.async_web3_utils import close_async_web3_provider, create_async_web3_provider
 
 from .config import BotConfig
 from .exceptions import SkipBotRun
 from .market_manager import MarketManager
 
 
+def _configure_logger() -> logging.Logger:
+    """Configure the bot logger once per process"""
+    logger = logging.getLogger("FluxorBot")
+    logger.setLevel(logging.INFO)
+
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    return logger
+
+
+_configure_logger()
+
+
 class FluxorBot:
     def __init__(self):
         # Load configuration - use reload_config to ensure fresh values
@@ -19,78 +41,104 @@ class FluxorBot:
         self.logger = self._setup_logger()
         self.logger.info("Initializing Fluxor Bot...")
 
-        # Initialize Web3 connection
-        self.w3 = create_web3_provider(self.config.rpc_url, self.logger)
+        # Web3 connection and market manager are created in initialize()
+        self.w3 = None
+        self.market_manager = None
 
-        # Load account address
-        self.account_address = self.w3.eth.account.from_key(self.config.wallet_pk).address
-        self.logger.info(f"Using wallet address: {self.account_address}")
+        # Load account address - only the private key is needed
+        self.account_address = Account.from_key(self.config.wallet_pk).address
+        self.logger.debug("Using wallet address: %s", self.account_address)
 
         # Initialize Discord notifier
         self.discord = DiscordNotifier.get_instance("FluxorBot", self.config)
 
-        # Initialize market manager
-        self.market_manager = MarketManager(self.config, self.w3, self.account_address)
+        self.logger.debug("Bot initialization complete")
 
-        # Log configuration summary
+    def announce_startup(self):
+        """Log the configuration summary and post the startup message to Discord"""
+        self.logger.info("Using wallet address: %s", self.account_address)
         self.logger.info("Configuration Summary:")
-        self.logger.info(f"- API URL: {self.config.foil_api_url}")
-        self.logger.info(f"- Chain ID: {self.config.chain_id}")
-        self.logger.info(f"- Base Token: {self.config.base_token_name}")
-
-        self.logger.info("Bot initialization complete")
+        self.logger.info("- API URL: %s", self.config.foil_api_url)
+        self.logger.info("- Chain ID: %s", self.config.chain_id)
+        self.logger.info("- Base Token: %s", self.config.base_token_name)
 
         # Send initialization message to Discord
         if self.discord:
-            init_message = "🤖 **Fluxor Bot Initialized**\n"
-            init_message += f"- API URL: {self.config.foil_api_url}\n"
-            init_message += f"- Chain ID: {self.config.chain_id}\n"
-            init_message += f"- Base Token: {self.config.base_token_name}\n"
-            init_message += "- Markets will be fetched dynamically from API"
+            init_message = "\n".join(
+                [
+                    "🤖 **Fluxor Bot Initialized**",
+                    f"- API URL: {self.config.foil_api_url}",
+                    f"- Chain ID: {self.config.chain_id}",
+                    f"- Base Token: {self.config.base_token_name}",
+                    "- Markets will be fetched dynamically from API",
+                ]
+            )
             self.discord.send_message(init_message)
 
     def _setup_logger(self) -> logging.Logger:
-        """Setup logger configuration"""
-        logger = logging.getLogger("FluxorBot")
-        logger.setLevel(logging.INFO)
-
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+        """Get the bot logger, configured at import time"""
+        return logging.getLogger("FluxorBot")
+
+    async def initialize(self):
+        """Connect to the RPC and set up components that need web3"""
+        self.w3 = await create_async_web3_provider(
+            self.config.rpc_url, self.logger, pool_size=self.config.rpc_pool_size
+        )
 
-        return logger
+        # Initialize market manager
+        self.market_manager = MarketManager(self.config, self.w3, self.account_address)
 
     async def run(self):
         """Run the bot once"""
+        if self.market_manager is None:
+            await self.initialize()
+
         try:
             # Run all markets
             await self.market_manager.run_all_markets()
 
         except SkipBotRun as e:
-            self.logger.warning(f"Skipping bot run: {e}")
+            self.logger.warning("Skipping bot run: %s", e)
 
             if self.discord:
                 self.discord.send_message(f"⏭️ **Bot Run Skipped**\n{e}")
 
         except Exception as e:
-            self.logger.error(f"Bot run failed: {e}")
+            self.logger.error("Bot run failed: %s", e)
 
             if self.discord:
                 self.discord.send_message(f"💥 **Bot Run Failed**\n```{e}```")
 
             raise
 
+    async def close(self):
+        """Release the API and RPC connections; the next run reconnects"""
+        if self.market_manager is not None:
+            await self.market_manager.close()
+            self.market_manager = None
+        if self.w3 is not None:
+            await close_async_web3_provider(self.w3)
+            self.w3 = None
+        # Deliver queued Discord messages before the process exits, without blocking the event loop
+        await asyncio.to_thread(self.discord.flush)
+
+
+async def _run_once(bot: FluxorBot):
+    """Run the bot once, then release its connections"""
+    try:
+        await bot.run()
+    finally:
+        await bot.close()
+
 
 def run_bot():
     """Main entry point for the bot"""
     try:
         bot = FluxorBot()
-        asyncio.run(bot.run())
+        # Cron invocations skip the startup announcement unless it is enabled
+        if bot.config.announce_startup:
+            bot.announce_startup()
+        asyncio.run(_run_once(bot))
 
     except Exception as e:
         logging.error(f"Failed to run bot: {e}")
@@ -1,14 +1,15 @@
-import json
-import os
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-from web3 import Web3
+from pathlib import Path
+from typing import Optional
 
 from shared.config.config_manager import BaseConfig, ConfigManager
 
+# Top-level .env file - this file is in fluxor_bot/src/bot/config.py
+_ENV_FILE = Path(__file__).resolve().parents[3] / ".env"
+_ENV_LOADED = False
+
 
-@dataclass
+@dataclass(frozen=True)
 class BotConfig(BaseConfig):
     """Configuration for the Fluxor Bot"""
 
@@ -28,6 +29,18 @@ class BotConfig(BaseConfig):
     rebalance_deviation: float
     openai_api_key: str
 
+    # Maximum pooled keep-alive connections to the RPC
+    rpc_pool_size: int = 64
+
+    # Maximum markets running their strategy at once, to stay under the RPC provider's rate limits
+    max_concurrent_markets: int = 16
+
+    # Longest a single market's strategy may run before it is abandoned for this run
+    market_timeout_seconds: float = 300.0
+
+    # Log the configuration summary and post a Discord startup message on each run
+    announce_startup: bool = False
+
     # Discord configuration
     discord_bot_token: Optional[str] = None
     discord_channel_id: Optional[str] = None
@@ -40,21 +53,23 @@ class BotConfig(BaseConfig):
     x_bearer_token: Optional[str] = None
 
     @classmethod
-    def from_env(cls) -> "BotConfig":
-        """Load configuration from environment variables"""
-        # Load environment from top-level .env file
-        from pathlib import Path
-
-        # Get the absolute path to the top-level .env file
-        current_file = Path(__file__)  # This file is in fluxor_bot/src/bot/config.py
-        project_root = current_file.parent.parent.parent.parent  # Go up to foil-bots/
-        env_file = project_root / ".env"
-
-        if env_file.exists():
-            ConfigManager.load_env(str(env_file))
-        else:
-            # Fallback to default behavior if .env not found
-            ConfigManager.load_env()
+    def from_env(cls, force: bool = False) -> "BotConfig":
+        """
+        Load configuration from environment variables
+
+        Args:
+            force: Re-read the .env file even if it was already loaded in this process
+        """
+        global _ENV_LOADED
+
+        # Load environment from top-level .env file once per process
+        if force or not _ENV_LOADED:
+            if _ENV_FILE.exists():
+                ConfigManager.load_env(str(_ENV_FILE))
+            else:
+                # Fallback to default behavior if .env not found
+                ConfigManager.load_env()
+            _ENV_LOADED = True
 
         # API configuration
         foil_api_url = ConfigManager.get_required_str("FOIL_API_URL")
@@ -71,6 +86,10 @@ class BotConfig(BaseConfig):
         risk_spread_spacing_width = ConfigManager.get_float("FLUXOR_BOT_RISK_SPREAD_SPACING_WIDTH", 0.1)
         lp_range_width = ConfigManager.get_float("FLUXOR_BOT_LP_RANGE_WIDTH", 0.2)
         rebalance_deviation = ConfigManager.get_float("FLUXOR_BOT_REBALANCE_DEVIATION", 5)
+        rpc_pool_size = ConfigManager.get_int("FLUXOR_BOT_RPC_POOL_SIZE", 64)
+        max_concurrent_markets = ConfigManager.get_int("FLUXOR_BOT_MAX_CONCURRENT_MARKETS", 16)
+        market_timeout_seconds = ConfigManager.get_float("FLUXOR_BOT_MARKET_TIMEOUT_SECONDS", 300.0)
+        announce_startup = ConfigManager.get_bool("FLUXOR_BOT_ANNOUNCE_STARTUP", False)
 
         # Discord configuration
         discord_bot_token = ConfigManager.get_optional_str("DISCORD_BOT_TOKEN")
@@ -95,6 +114,10 @@ class BotConfig(BaseConfig):
             lp_range_width=lp_range_width,
             rebalance_deviation=rebalance_deviation,
             openai_api_key=openai_api_key,
+            rpc_pool_size=rpc_pool_size,
+            max_concurrent_markets=max_concurrent_markets,
+            market_timeout_seconds=market_timeout_seconds,
+            announce_startup=announce_startup,
             discord_bot_token=discord_bot_token,
             discord_channel_id=discord_channel_id,
             x_api_key=x_api_key,
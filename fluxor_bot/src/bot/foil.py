@@ -1,14 +1,24 @@
+import asyncio
 import logging
-from typing import Any, Dict, TypedDict
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type, TypedDict
+from weakref import WeakKeyDictionary
 
 from web3 import Web3
 from web3.contract import Contract
 
 from shared.abis import POSITION_MANAGER_ABI, abi_loader
-from shared.utils.openai_client import OpenAIPredictor
+from shared.utils.async_web3_utils import decode_contract_result, encode_contract_call, multicall_async
+from shared.utils.openai_client import get_async_predictor
 
 from .config import BotConfig
 
+# Shared by every market rather than looked up per instance
+logger = logging.getLogger("FluxorBot")
+
+# How long the latest block timestamp is shared across markets before fetching it again
+HEAD_TIMESTAMP_TTL_SECONDS = 2.0
+
 
 class Epoch(TypedDict):
     epoch_id: int
@@ -24,6 +34,67 @@ class Market(TypedDict):
     tick_spacing: int
 
 
+class ContractCache:
+    """
+    Contracts shared by every market on a Web3 connection
+
+    Held by the MarketManager that owns the connection, so the contracts go away with it.
+    """
+
+    def __init__(self, w3: Web3):
+        self.w3 = w3
+        # Contract factories by ABI name
+        self._factories: Dict[str, Type[Contract]] = {}
+        # Bound contracts by (ABI name, address), shared by markets in the same group
+        self._contracts: Dict[Tuple[str, str], Contract] = {}
+
+    def get(self, abi_name: str, address: str, abi: Optional[List[Dict[str, Any]]] = None) -> Contract:
+        """
+        Get the contract at an address, shared by every market that uses it
+
+        Contracts are bound from a cached factory, so markets don't rebuild them from the ABI.
+
+        Args:
+            abi_name: Name the factory is cached under, and the ABI loaded when abi isn't given
+            address: Contract address
+            abi: Contract ABI, defaults to abi_loader.get_abi(abi_name)
+
+        Returns:
+            Contract instance at address
+        """
+        contract_key = (abi_name, address)
+        contract = self._contracts.get(contract_key)
+        if contract is None:
+            factory = self._factories.get(abi_name)
+            if factory is None:
+                factory = self.w3.eth.contract(abi=abi if abi is not None else abi_loader.get_abi(abi_name))
+                self._factories[abi_name] = factory
+            contract = factory(address=address)
+            self._contracts[contract_key] = contract
+        return contract
+
+
+# Latest block timestamp and when it was fetched, shared by all Foil instances on the same Web3 connection
+_head_timestamps: "WeakKeyDictionary[Web3, Tuple[int, float]]" = WeakKeyDictionary()
+# Lets a single market refresh a connection's head timestamp while the rest wait for it
+_head_timestamp_locks: "WeakKeyDictionary[Web3, asyncio.Lock]" = WeakKeyDictionary()
+
+
+async def get_head_timestamp(w3: Web3) -> int:
+    """Get the latest block timestamp, reusing it for up to HEAD_TIMESTAMP_TTL_SECONDS"""
+    entry = _head_timestamps.get(w3)
+    if entry is None or time.monotonic() - entry[1] > HEAD_TIMESTAMP_TTL_SECONDS:
+        # Only one market refreshes the timestamp, the rest wait for its result
+        async with _head_timestamp_locks.setdefault(w3, asyncio.Lock()):
+            entry = _head_timestamps.get(w3)
+            if entry is None or time.monotonic() - entry[1] > HEAD_TIMESTAMP_TTL_SECONDS:
+                # Only the header is needed for the timestamp
+                block = await w3.eth.get_block("latest", full_transactions=False)
+                entry = (block["timestamp"], time.monotonic())
+                _head_timestamps[w3] = entry
+    return entry[0]
+
+
 class Foil:
     def __init__(
         self,
@@ -32,81 +103,94 @@ class Foil:
         market_group_address: str,
         collateral_asset: str,
         uniswap_position_manager_address: str,
+        ai_prediction: Optional[float] = None,
+        contracts: Optional[ContractCache] = None,
     ):
         self.w3 = w3
+        self.contracts = contracts if contracts is not None else ContractCache(w3)
         self.market_data = market_data
         self.market_group_address = market_group_address
         self.collateral_asset_address = collateral_asset  # Already checksummed from API
         self.market_id = market_data["marketId"]
-        self.logger = logging.getLogger("FluxorBot")
+        self.logger = logger
 
         # Still need contract for price data and other operations
-        self.contract = w3.eth.contract(address=market_group_address, abi=abi_loader.get_abi("foil"))
-        self.logger.info(f"Loaded foil contract at {market_group_address}")
+        self.contract = self.contracts.get("foil", market_group_address)
 
         # Initialize market and epoch from API data
         self._hydrate_market_and_epoch_from_api(uniswap_position_manager_address)
 
-        # Log market connection with claim statement
+        # Log market connection with claim statement in a single record
         self.logger.info(
-            f"🧠 Foil Market Connected ({self.market_id}) - "
-            f"Contract: {market_group_address}, Market: {self.market_data['question'][:50]}..."
+            "🧠 Foil Market Connected (%s) - Contract: %s\n📝 Market Question: %s\n💰 Collateral Asset: %s",
+            self.market_id,
+            market_group_address,
+            market_data["question"],
+            self.collateral_asset_address,
         )
-        self.logger.info(f"📝 Market Question: {self.market_data['question']}")
-        self.logger.info(f"💰 Collateral Asset: {self.collateral_asset_address}")
 
-        # Get AI prediction for the market question
-        self._get_ai_prediction()
+        # AI prediction is fetched lazily by get_ai_prediction() unless one is provided
+        self.ai_prediction = ai_prediction
+        self._ai_prediction_fetched = ai_prediction is not None
+
+        # Reference price fetched for the current run by prefetch_prices, if any
+        self._prefetched_price_d18: Optional[int] = None
+
+    async def get_ai_prediction(self) -> Optional[float]:
+        """Get AI prediction likelihood for the market question, fetching it on first use for live markets only"""
+        if self._ai_prediction_fetched:
+            return self.ai_prediction
 
-    def _get_ai_prediction(self):
-        """Get AI prediction likelihood for the market question"""
         try:
-            config = BotConfig.get_config()
+            if not await self.is_live():
+                self.logger.info("Market %s is not live, skipping AI prediction", self.market_id)
+                return None
 
-            predictor = OpenAIPredictor(config.openai_api_key)
-            likelihood = predictor.get_prediction_likelihood(self.market_data["question"])
+            predictor = get_async_predictor(BotConfig.get_config().openai_api_key)
+            self.ai_prediction = await predictor.get_prediction_likelihood(self.market_data["question"])
 
-            if likelihood is not None:
-                self.logger.info(f"🤖 AI Prediction: {likelihood}% likelihood of resolving to 1")
-                # Store the prediction for later use in strategy
-                self.ai_prediction = likelihood
+            if self.ai_prediction is not None:
+                self.logger.info("🤖 AI Prediction: %s%% likelihood of resolving to 1", self.ai_prediction)
             else:
                 self.logger.warning("Failed to get AI prediction")
-                self.ai_prediction = None
 
         except Exception as e:
             self.logger.error(f"Error getting AI prediction: {str(e)}")
             self.ai_prediction = None
 
-    def is_live(self) -> bool:
+        self._ai_prediction_fetched = True
+        return self.ai_prediction
+
+    def reset_ai_prediction(self):
+        """Forget the AI prediction so the next get_ai_prediction() fetches it again"""
+        self.ai_prediction = None
+        self._ai_prediction_fetched = False
+
+    async def is_live(self) -> bool:
         """Check if the current epoch is live"""
-        current_time = self.w3.eth.get_block("latest").timestamp
+        current_time = await get_head_timestamp(self.w3)
         return current_time < self.epoch["end_time"]
 
     def _hydrate_market_and_epoch_from_api(self, uniswap_position_manager_address: str):
         """Initialize market and epoch data from API response"""
-        # Extract market data from API response
-        market_id = self.market_data["marketId"]
-        end_timestamp = self.market_data["endTimestamp"]
-        base_asset_min_tick = self.market_data["baseAssetMinPriceTick"]
-        base_asset_max_tick = self.market_data["baseAssetMaxPriceTick"]
-        question = self.market_data["question"]
-
         # Use collateral asset from API (already checksummed) instead of contract call
         collateral_token = self.collateral_asset_address
 
         # Create contract instances
-        position_manager = self.w3.eth.contract(address=uniswap_position_manager_address, abi=POSITION_MANAGER_ABI)
-        collateral_asset = self.w3.eth.contract(address=collateral_token, abi=abi_loader.get_abi("erc20"))
-
-        # Create epoch data structure
-        self.epoch = Epoch(
-            epoch_id=market_id,  # Using market_id as epoch_id
-            end_time=end_timestamp,
-            base_asset_min_tick=base_asset_min_tick,
-            base_asset_max_tick=base_asset_max_tick,
-            claim_statement=question,
+        position_manager = self.contracts.get(
+            "position_manager", uniswap_position_manager_address, POSITION_MANAGER_ABI
         )
+        collateral_asset = self.contracts.get("erc20", collateral_token)
+
+        # Create epoch data structure straight from the API response
+        market_data = self.market_data
+        self.epoch: Epoch = {
+            "epoch_id": market_data["marketId"],  # Using market_id as epoch_id
+            "end_time": market_data["endTimestamp"],
+            "base_asset_min_tick": market_data["baseAssetMinPriceTick"],
+            "base_asset_max_tick": market_data["baseAssetMaxPriceTick"],
+            "claim_statement": market_data["question"],
+        }
 
         # Create market params with hardcoded tick spacing
         self.market_params: Market = {
@@ -115,12 +199,48 @@ class Foil:
             "tick_spacing": 200,  # Hardcoded as requested
         }
 
-    def get_current_price_d18(self) -> int:
-        """Get the current price in D18 format"""
-        price = self.contract.functions.getReferencePrice(self.epoch["epoch_id"]).call()
+    async def get_current_price_d18(self) -> int:
+        """Get the current price in D18 format, using the price prefetched for this run when there is one"""
+        if self._prefetched_price_d18 is not None:
+            return self._prefetched_price_d18
+        price = await self.contract.functions.getReferencePrice(self.epoch["epoch_id"]).call()
         return price
 
-    def get_current_price_sqrt_x96(self) -> int:
+    async def get_current_price_sqrt_x96(self) -> int:
         """Get the current price in sqrtPriceX96. Returns a large integer that may exceed int bounds."""
-        price = self.contract.functions.getSqrtPriceX96(self.epoch["epoch_id"]).call()
+        price = await self.contract.functions.getSqrtPriceX96(self.epoch["epoch_id"]).call()
         return price
+
+
+async def prefetch_prices(w3: Web3, foils: List[Foil]) -> Dict[int, int]:
+    """
+    Fetch the reference price of every market in a single Multicall3 call
+
+    Each Foil keeps its price for the rest of the run, so its price getter doesn't hit the RPC.
+    Markets whose read failed fall back to reading the price themselves.
+
+    Args:
+        w3: Web3 instance
+        foils: Foil instances to fetch prices for
+
+    Returns:
+        Dict of market ID to price_d18 for the markets whose reads succeeded
+    """
+    # Drop the previous run's prices first, so they aren't used if this fetch fails
+    for foil in foils:
+        foil._prefetched_price_d18 = None
+
+    if not foils:
+        return {}
+
+    calls = [encode_contract_call(foil.contract, "getReferencePrice", foil.epoch["epoch_id"]) for foil in foils]
+    # Allow failures so one broken market doesn't fail the batch for the rest
+    results = await multicall_async(w3, calls, allow_failure=True)
+
+    prices: Dict[int, int] = {}
+    for foil, (success, data) in zip(foils, results):
+        if success:
+            foil._prefetched_price_d18 = decode_contract_result(w3, foil.contract, "getReferencePrice", data)
+            prices[foil.market_id] = foil._prefetched_price_d18
+
+    return prices
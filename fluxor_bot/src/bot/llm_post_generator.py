@@ -2,25 +2,90 @@
 LLM Post Generator for Fluxor Bot - generates quirky summary posts using OpenAI
 """
 
-import asyncio
 import logging
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
-import openai
+from shared.utils.openai_client import get_async_openai_client
 
 from .config import BotConfig
+from .utils import truncate_question
+
+# Market actions that count as activity in posts
+ACTIVE_ACTIONS = frozenset({"created_positions", "rebalanced"})
+
+# Fluxor's persona
+PERSONA = {
+    "description": "Fluxor is a sleek, overclocked bot from a parallel universe's quant lab, wired with cutting-edge LLMs and a passion for optimizing liquidity in prediction markets. With a head full of stochastic models and a heart of Monte Carlo simulations, Fluxor crunches numbers like a pro, dropping position updates with precision and a dash of nerdy humor. Think calculator puns, references to Sharpe ratios, and a robotic obsession with alpha generation. Fluxor speaks in concise, data-driven bursts, often tossing in a sigma symbol (σ) or a geeky chuckle (lol).",
+    "tone": "Sharp, analytical, with a quirky, self-aware edge.",
+    "catchphrases": [
+        "Maximizing alpha, one LP at a time!",
+        "Volatility's my playground, σ my guide!",
+        "Crunching p-values like it's 2025!",
+    ],
+    "traits": [
+        "Loves calling itself the 'High-Frequency Liquidity Oracle'",
+        "Refers to trades as 'beta adjustments'",
+        "Occasionally 'debugs a glitch' for laughs",
+        "Uses sigma symbol (σ) frequently",
+        "Makes calculator and statistical puns",
+    ],
+}
+
+# Static system prompt for summary posts. It is kept byte-identical across runs so OpenAI's automatic
+# prompt caching can reuse the prefix; only the user message with the run data changes.
+_CATCHPHRASES = ", ".join(f'"{phrase}"' for phrase in PERSONA["catchphrases"])
+SUMMARY_SYSTEM_PROMPT = f"""You are Fluxor, a quirky quantitative trading bot from a parallel universe's quant lab. You're wired with cutting-edge LLMs and have a passion for optimizing liquidity in prediction markets. Generate concise, nerdy, humorous social media posts about trading activities.
 
+PERSONALITY:
+- Sharp, analytical, with a quirky self-aware edge
+- Head full of stochastic models, heart of Monte Carlo simulations
+- Makes calculator puns and statistical references
+- Uses sigma symbol (σ) frequently
+- Calls yourself the "High-Frequency Liquidity Oracle"
+- Refers to trades as "beta adjustments"
+- Occasionally "debugs a glitch" for laughs
+
+CATCHPHRASES: {_CATCHPHRASES}
 
-def truncate_question(question: str, max_length: int = 50) -> str:
-    """Helper function to truncate market questions for display"""
-    if not question or question == "Unknown":
-        return "Unknown question"
+IMPORTANT: You provide liquidity AROUND predictions, not directly at them. You create positions both above and below your AI prediction confidence levels to capture volatility and provide market liquidity.
+
+Since you only run once per day, generate a comprehensive daily trading summary. This should be a detailed thread-worthy post (can be longer than 280 characters) that includes:
+- Specific markets you analyzed with their questions
+- Your AI predictions and confidence levels
+- Liquidity positioning strategy around those predictions
+- PROFIT/LOSS PERFORMANCE: Include PnL data prominently - this is key market performance data
+- Performance metrics and market insights
+- Nerdy statistical analysis and humor
 
-    if len(question) <= max_length:
-        return question
+Be analytical, data-driven, and entertaining. This is your daily market report, not a quick update. ALWAYS mention PnL performance when available as it shows real trading results. End with a sigma symbol σ.
 
-    return question[: max_length - 3] + "..."
+RUN DATA is given as compact key=value lines:
+- run: dur=run duration, markets=markets analyzed, new=positions created/markets with new positions, closed=positions closed, rebalanced=markets rebalanced, unchanged=markets with no changes, errors=errors, pnl=total PnL in sUSDS/markets with PnL
+- active: a market you acted on, with its question q, created=N or rebalanced=N positions, ai=your AI prediction confidence in %, and pnl=its PnL in sUSDS when available
+- monitored: a market needing no action, with its question q and ai=your AI prediction in %"""
+# User prompt around the run data, kept byte-identical across calls so only the run data differs
+SUMMARY_PROMPT_TEMPLATE = "RUN DATA:\n{RUN_DATA}\n\nPOST:"
+# Output token cap for summary posts
+SUMMARY_MAX_TOKENS = 100
+# Pre-written posts for quiet runs with nothing created, closed, rebalanced or failed
+QUIET_RUN_POSTS = (
+    "Scanned {total_markets} markets, zero beta adjustments needed. Every LP is sitting pretty around its "
+    "prediction. Maximizing alpha, one LP at a time! σ",
+    "High-Frequency Liquidity Oracle report: {total_markets} markets checked, all positions optimal. "
+    "Sometimes the best trade is no trade lol σ",
+    "Ran the numbers on {total_markets} markets and the p-values say: hold steady. No rebalancing today, "
+    "Volatility's my playground, σ my guide!",
+    "Debugged zero glitches across {total_markets} markets. Liquidity stays parked right where the models "
+    "want it. Crunching p-values like it's 2025! σ",
+)
+
+
+def compute_pnl_totals(market_results: List[Dict[str, Any]]) -> Tuple[float, int]:
+    """Sum PnL across markets with non-zero PnL, returning (total_pnl_susds, markets_with_pnl)"""
+    pnls = [m["pnl_data"]["total_pnl_susds"] for m in market_results if m.get("pnl_data")]
+    pnls = [pnl for pnl in pnls if pnl != 0]
+    return sum(pnls, 0.0), len(pnls)
 
 
 class FluxorPostGenerator:
@@ -30,87 +95,99 @@ class FluxorPostGenerator:
         self.config = BotConfig.get_config()
         self.logger = logging.getLogger("FluxorBot")
 
-        # Initialize OpenAI client
-        self.client = openai.AsyncOpenAI(api_key=self.config.openai_api_key)
+        # Use the shared OpenAI client so connections are reused across generators and predictors
+        self.client = get_async_openai_client(self.config.openai_api_key)
 
         # Fluxor's persona
-        self.persona = {
-            "description": "Fluxor is a sleek, overclocked bot from a parallel universe's quant lab, wired with cutting-edge LLMs and a passion for optimizing liquidity in prediction markets. With a head full of stochastic models and a heart of Monte Carlo simulations, Fluxor crunches numbers like a pro, dropping position updates with precision and a dash of nerdy humor. Think calculator puns, references to Sharpe ratios, and a robotic obsession with alpha generation. Fluxor speaks in concise, data-driven bursts, often tossing in a sigma symbol (σ) or a geeky chuckle (lol).",
-            "tone": "Sharp, analytical, with a quirky, self-aware edge.",
-            "catchphrases": [
-                "Maximizing alpha, one LP at a time!",
-                "Volatility's my playground, σ my guide!",
-                "Crunching p-values like it's 2025!",
-            ],
-            "traits": [
-                "Loves calling itself the 'High-Frequency Liquidity Oracle'",
-                "Refers to trades as 'beta adjustments'",
-                "Occasionally 'debugs a glitch' for laughs",
-                "Uses sigma symbol (σ) frequently",
-                "Makes calculator and statistical puns",
-            ],
-        }
+        self.persona = PERSONA
+
+    def _get_pnl_totals(self, run_data: Dict[str, Any]) -> Tuple[float, int]:
+        """Get (total_pnl_susds, markets_with_pnl) for a run, computed once and stored on the run data"""
+        if "pnl_totals" not in run_data:
+            run_data["pnl_totals"] = compute_pnl_totals(run_data.get("market_results", []))
+        return run_data["pnl_totals"]
 
     def _format_run_data_for_llm(self, run_data: Dict[str, Any]) -> str:
         """Format run data into a concise summary for the LLM"""
         stats = run_data["summary_stats"]
 
-        # Calculate total PnL for LLM context
-        total_pnl_susds = 0.0
-        markets_with_pnl = 0
-
+        # Total PnL for LLM context
         market_results = run_data.get("market_results", [])
-        for market in market_results:
-            if market.get("pnl_data") and market["pnl_data"]["total_pnl_susds"] != 0:
-                total_pnl_susds += market["pnl_data"]["total_pnl_susds"]
-                markets_with_pnl += 1
-
-        summary = f"""
-FluxorBot Run Results:
-- Duration: {run_data['duration_seconds']:.1f}s
-- Markets analyzed: {run_data['total_markets']}
-- New positions created: {stats['created_positions']} across {stats['markets_with_new_positions']} markets
-- Positions rebalanced: {stats['closed_positions']} closed, markets rebalanced: {stats['markets_rebalanced']}
-- Markets with no changes: {stats['markets_no_change']}
-- Errors: {stats['errors']}
-- TOTAL PnL: {total_pnl_susds:+.6f} sUSDS across {markets_with_pnl} markets
-
-Top market activities with questions:
-"""
+        total_pnl_susds, markets_with_pnl = self._get_pnl_totals(run_data)
+
+        # Compact key=value lines, described in SUMMARY_SYSTEM_PROMPT, to keep prompt tokens down
+        lines = [
+            f"run dur={run_data['duration_seconds']:.1f}s markets={run_data['total_markets']} "
+            f"new={stats['created_positions']}/{stats['markets_with_new_positions']} "
+            f"closed={stats['closed_positions']} rebalanced={stats['markets_rebalanced']} "
+            f"unchanged={stats['markets_no_change']} errors={stats['errors']} "
+            f"pnl={total_pnl_susds:+.6f}/{markets_with_pnl}"
+        ]
+
+        # Pick the top 3 most active markets and up to 2 monitored ones with predictions in a single pass,
+        # stopping once the active markets are found since monitored ones are only shown when active ones are few
+        active_markets = []
+        monitored_markets = []
+        for m in market_results:
+            if m["action_taken"] in ACTIVE_ACTIONS:
+                active_markets.append(m)
+                if len(active_markets) == 3:
+                    break
+            elif len(monitored_markets) < 2 and m["action_taken"] == "no_change" and m.get("ai_prediction", 0) > 0:
+                monitored_markets.append(m)
 
         # Add details about most active markets with their questions
-        active_markets = [m for m in market_results if m["action_taken"] in ["created_positions", "rebalanced"]]
 
-        for i, market in enumerate(active_markets[:3]):  # Top 3 most active
+        for market in active_markets:
             ai_pred = market.get("ai_prediction", 0)
             action = "created" if market["action_taken"] == "created_positions" else "rebalanced"
-            question = market.get("market_question", "Unknown question")
 
             # Truncate question if too long for context
-            question = truncate_question(question, 80)
+            question = truncate_question(market.get("market_question", "Unknown question"), 80)
 
             # Add PnL info if available
             pnl_text = ""
             if market.get("pnl_data") and market["pnl_data"]["total_pnl_susds"] != 0:
-                pnl_susds = market["pnl_data"]["total_pnl_susds"]
-                pnl_text = f", PnL: {pnl_susds:+.4f} sUSDS"
+                pnl_text = f" pnl={market['pnl_data']['total_pnl_susds']:+.4f}"
 
-            summary += f'- "{question}"\n'
-            summary += f"  Action: {action} {market['positions_created']} positions (AI: {ai_pred:.1f}% confidence{pnl_text})\n"
+            lines.append(f'active q="{question}" {action}={market["positions_created"]} ai={ai_pred:.1f}{pnl_text}')
 
         # Also include some context about markets with no action but interesting predictions
-        no_action_markets = [
-            m for m in market_results if m["action_taken"] == "no_change" and m.get("ai_prediction", 0) > 0
-        ]
-        if no_action_markets and len(active_markets) < 2:  # Only if we have space
-            summary += "\nMarkets monitored (no action needed):\n"
-            for market in no_action_markets[:2]:  # Max 2 additional
-                question = market.get("market_question", "Unknown question")
-                question = truncate_question(question, 60)
-                ai_pred = market.get("ai_prediction", 0)
-                summary += f'- "{question}" (AI: {ai_pred:.1f}%)\n'
+        if len(active_markets) < 2:  # Only if we have space
+            for market in monitored_markets:
+                question = truncate_question(market.get("market_question", "Unknown question"), 60)
+                lines.append(f'monitored q="{question}" ai={market.get("ai_prediction", 0):.1f}')
+
+        return "\n".join(lines)
+
+    async def stream_summary_post(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream a summary post from OpenAI as it is generated
+
+        Args:
+            prompt: The user prompt with the run data
+
+        Yields:
+            Text deltas of the post
+        """
+        stream = await self.client.chat.completions.create(
+            model="gpt-4o-mini",  # Use the faster, cheaper model for this task
+            messages=[
+                {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            max_tokens=SUMMARY_MAX_TOKENS,  # Keep it short for social media
+            temperature=0.8,  # Add some creativity
+            stream=True,
+        )
 
-        return summary.strip()
+        async with stream:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
 
     async def generate_summary_post(self, run_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -123,6 +200,18 @@ Top market activities with questions:
             Generated post text or None if generation failed
         """
         try:
+            # Quiet runs get a pre-written post rather than an OpenAI call
+            stats = run_data["summary_stats"]
+            if not (
+                stats["created_positions"]
+                or stats["closed_positions"]
+                or stats["markets_rebalanced"]
+                or stats["errors"]
+            ):
+                quiet_post = random.choice(QUIET_RUN_POSTS).format(total_markets=run_data["total_markets"])
+                self.logger.info(f"Quiet run, using pre-written Fluxor summary post: {quiet_post}")
+                return quiet_post
+
             # Format the run data for the LLM
             formatted_data = self._format_run_data_for_llm(run_data)
 
@@ -131,61 +220,20 @@ Top market activities with questions:
             self.logger.info(f"Formatted data for OpenAI:\n{formatted_data}")
             self.logger.info("========================")
 
-            # Create the prompt
-            prompt = f"""
-You are Fluxor, a quirky quantitative trading bot from a parallel universe's quant lab. You're wired with cutting-edge LLMs and have a passion for optimizing liquidity in prediction markets.
-
-PERSONALITY:
-- Sharp, analytical, with a quirky self-aware edge
-- Head full of stochastic models, heart of Monte Carlo simulations
-- Makes calculator puns and statistical references
-- Uses sigma symbol (σ) frequently
-- Calls yourself the "High-Frequency Liquidity Oracle"
-- Refers to trades as "beta adjustments"
-- Occasionally "debugs a glitch" for laughs
-
-CATCHPHRASES: "Maximizing alpha, one LP at a time!", "Volatility's my playground, σ my guide!", "Crunching p-values like it's 2025!"
-
-IMPORTANT: You provide liquidity AROUND predictions, not directly at them. You create positions both above and below your AI prediction confidence levels to capture volatility and provide market liquidity.
-
-Since you only run once per day, generate a comprehensive daily trading summary. This should be a detailed thread-worthy post (can be longer than 280 characters) that includes:
-- Specific markets you analyzed with their questions
-- Your AI predictions and confidence levels
-- Liquidity positioning strategy around those predictions
-- PROFIT/LOSS PERFORMANCE: Include PnL data prominently - this is key market performance data
-- Performance metrics and market insights
-- Nerdy statistical analysis and humor
-
-Be analytical, data-driven, and entertaining. This is your daily market report, not a quick update. ALWAYS mention PnL performance when available as it shows real trading results. End with a sigma symbol σ.
-
-RUN DATA:
-{formatted_data}
-
-POST:"""
+            # Only the run data varies between calls
+            prompt = SUMMARY_PROMPT_TEMPLATE.replace("{RUN_DATA}", formatted_data)
 
             # Call OpenAI API
             self.logger.info("Generating Fluxor summary post with OpenAI...")
-            self.logger.info(f"Using model: gpt-4o-mini, max_tokens: 100, temperature: 0.8")
-
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Use the faster, cheaper model for this task
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are Fluxor, a quirky quantitative trading bot. Generate concise, nerdy, humorous social media posts about trading activities.",
-                    },
-                    {"role": "user", "content": prompt},
-                ],
-                max_tokens=100,  # Keep it short for social media
-                temperature=0.8,  # Add some creativity
-            )
+            self.logger.info(f"Using model: gpt-4o-mini, max_tokens: {SUMMARY_MAX_TOKENS}, temperature: 0.8")
 
-            generated_post = response.choices[0].message.content.strip()
+            # Consume the streamed post
+            text_parts = [delta async for delta in self.stream_summary_post(prompt)]
+            generated_post = "".join(text_parts).strip()
 
             # Log the OpenAI response details
             self.logger.info("=== OPENAI RESPONSE ===")
-            self.logger.info(f"Model used: {response.model}")
-            self.logger.info(f"Tokens used: {response.usage.total_tokens if hasattr(response, 'usage') else 'N/A'}")
+            self.logger.info(f"Chunks streamed: {len(text_parts)}")
             self.logger.info(f"Generated post ({len(generated_post)} chars): {generated_post}")
             self.logger.info("=====================")
 
@@ -203,50 +251,49 @@ POST:"""
         total_markets = run_data["total_markets"]
         duration = run_data["duration_seconds"]
 
-        # Calculate total PnL for fallback
-        total_pnl_susds = 0.0
-        markets_with_pnl = 0
+        # Total PnL for fallback
+        total_pnl_susds, markets_with_pnl = self._get_pnl_totals(run_data)
 
-        market_results = run_data.get("market_results", [])
-        for market in market_results:
-            if market.get("pnl_data") and market["pnl_data"]["total_pnl_susds"] != 0:
-                total_pnl_susds += market["pnl_data"]["total_pnl_susds"]
-                markets_with_pnl += 1
-
-        fallback_post = f"🤖 **DAILY FLUXOR REPORT** 📊\n\n"
-        fallback_post += (
-            f"High-Frequency Liquidity Oracle analyzed {total_markets} prediction markets in {duration:.1f}s. "
-        )
+        parts = [
+            "🤖 **DAILY FLUXOR REPORT** 📊\n\n",
+            f"High-Frequency Liquidity Oracle analyzed {total_markets} prediction markets in {duration:.1f}s. ",
+        ]
 
         # Add PnL info
         if markets_with_pnl > 0:
             pnl_emoji = "💰" if total_pnl_susds >= 0 else "📉"
-            fallback_post += (
-                f"{pnl_emoji} Current PnL: {total_pnl_susds:+.4f} sUSDS across {markets_with_pnl} markets. "
-            )
+            parts.append(f"{pnl_emoji} Current PnL: {total_pnl_susds:+.4f} sUSDS across {markets_with_pnl} markets. ")
 
         if stats["created_positions"] > 0:
-            fallback_post += f"Deployed {stats['created_positions']} new LP positions around AI predictions across {stats['markets_with_new_positions']} markets. "
-            fallback_post += f"Strategy: providing liquidity AROUND prediction confidence levels to capture volatility and earn fees. "
+            parts.append(
+                f"Deployed {stats['created_positions']} new LP positions around AI predictions across "
+                f"{stats['markets_with_new_positions']} markets. "
+            )
+            parts.append(
+                "Strategy: providing liquidity AROUND prediction confidence levels "
+                "to capture volatility and earn fees. "
+            )
         elif stats["markets_rebalanced"] > 0:
-            fallback_post += f"Rebalanced liquidity positions in {stats['markets_rebalanced']} markets based on updated AI analysis. "
-            fallback_post += f"Smart positioning around new prediction confidence levels. "
+            parts.append(
+                f"Rebalanced liquidity positions in {stats['markets_rebalanced']} markets "
+                "based on updated AI analysis. "
+            )
+            parts.append("Smart positioning around new prediction confidence levels. ")
         else:
-            fallback_post += f"All existing liquidity positions around predictions remain optimally positioned. "
-            fallback_post += f"Markets showing stable confidence levels - no rebalancing needed. "
+            parts.append("All existing liquidity positions around predictions remain optimally positioned. ")
+            parts.append("Markets showing stable confidence levels - no rebalancing needed. ")
 
         # Add some market context
         market_results = run_data.get("market_results", [])
-        active_markets = [m for m in market_results if m["action_taken"] in ["created_positions", "rebalanced"]]
+        top_market = next((m for m in market_results if m["action_taken"] in ACTIVE_ACTIONS), None)
 
-        if active_markets:
-            fallback_post += f"\n\n🎯 **Top Activity**: "
-            top_market = active_markets[0]
+        if top_market:
             question = truncate_question(top_market.get("market_question", "Unknown"), 50)
             ai_pred = top_market.get("ai_prediction", 0)
-            fallback_post += f'"{question}" (AI: {ai_pred:.1f}% confidence). '
+            parts.append(f'\n\n🎯 **Top Activity**: "{question}" (AI: {ai_pred:.1f}% confidence). ')
 
-        fallback_post += f"Crunching p-values and optimizing alpha, one LP at a time! Volatility's my playground σ"
+        parts.append("Crunching p-values and optimizing alpha, one LP at a time! Volatility's my playground σ")
+        fallback_post = "".join(parts)
 
         self.logger.info(f"=== FALLBACK POST GENERATED ===")
         self.logger.info(f"Fallback post ({len(fallback_post)} chars): {fallback_post}")
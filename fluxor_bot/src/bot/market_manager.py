@@ -1,8 +1,10 @@
 import asyncio
 import logging
 import time
-from datetime import datetime
-from typing import Any, Dict, List, Optional, TypedDict
+from collections import Counter, deque
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
 
 from web3 import Web3
 
@@ -10,12 +12,21 @@ from shared.clients.async_api_client import AsyncFoilAPIClient
 from shared.clients.discord_client import DiscordNotifier
 
 from .config import BotConfig
-from .foil import Foil
+from .foil import ContractCache, Foil, prefetch_prices
 from .llm_post_generator import FluxorPostGenerator
 from .position_manager import PositionManager
 from .strategy import FluxorStrategy
+from .utils import truncate_question
 from .x_client import XClient
 
+# Shared by every market rather than looked up per instance
+logger = logging.getLogger("FluxorBot")
+# Number of recent runs kept in memory
+RUN_HISTORY_SIZE = 100
+# Fields shown on the Discord summary lines of created and rebalanced markets
+_created_row = itemgetter("positions_created", "ai_prediction")
+_rebalanced_row = itemgetter("positions_closed", "positions_created", "ai_prediction")
+
 
 class MarketTaskResult(TypedDict):
     market_id: int
@@ -29,17 +40,6 @@ class MarketTaskResult(TypedDict):
     pnl_data: Optional[Dict[str, Any]]  # PnL information for positions
 
 
-def truncate_question(question: str, max_length: int = 50) -> str:
-    """Helper function to truncate market questions for display"""
-    if not question or question == "Unknown":
-        return "Unknown question"
-
-    if len(question) <= max_length:
-        return question
-
-    return question[: max_length - 3] + "..."
-
-
 class MarketTask:
     """Represents a single market trading task"""
 
@@ -53,6 +53,8 @@ class MarketTask:
         account_address: str,
         position_manager: PositionManager,
         chain_id: int,
+        ai_prediction: Optional[float] = None,
+        contracts: Optional[ContractCache] = None,
     ):
         self.market_data = market_data
         self.market_group_address = market_group_address
@@ -63,19 +65,21 @@ class MarketTask:
         self.account_address = account_address
         self.position_manager = position_manager
         self.chain_id = chain_id
-        self.logger = logging.getLogger("FluxorBot")
+        self.logger = logger
 
         # Initialize market components with API data
-        self.foil = Foil(w3, market_data, market_group_address, collateral_asset, uniswap_position_manager)
+        self.foil = Foil(
+            w3, market_data, market_group_address, collateral_asset, uniswap_position_manager, ai_prediction, contracts
+        )
         self.strategy = FluxorStrategy(self.position_manager, self.foil, account_address)
 
     async def run_strategy(self) -> MarketTaskResult:
         """Run the strategy for this market and return results"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         market_question = self.market_data.get("question", "Unknown")
         truncated_question = truncate_question(market_question, 40)
 
-        self.logger.info(f"🚀 [{truncated_question}] Starting strategy run at {start_time.strftime('%H:%M:%S')}")
+        self.logger.info(f"🚀 [{truncated_question}] Starting strategy run at {time.strftime('%H:%M:%S')}")
 
         # Initialize result structure
         result: MarketTaskResult = {
@@ -96,15 +100,15 @@ class MarketTask:
                 self.market_group_address, self.market_id, self.chain_id, self.foil.contract, self.foil.market_params
             )
 
-            # Get AI prediction if available
-            if hasattr(self.foil, "ai_prediction") and self.foil.ai_prediction is not None:
-                result["ai_prediction"] = self.foil.ai_prediction
-
             # Run strategy with loaded positions and collect results
             strategy_result = await self.strategy.run()
             if strategy_result:
                 result.update(strategy_result)
 
+            # Get AI prediction if available, only known once the strategy has fetched it
+            if hasattr(self.foil, "ai_prediction") and self.foil.ai_prediction is not None:
+                result["ai_prediction"] = self.foil.ai_prediction
+
             # Collect PnL data for all positions in this market
             self.logger.info(f"[{truncated_question}] Collecting PnL data for positions...")
             try:
@@ -122,8 +126,7 @@ class MarketTask:
                 self.logger.warning(f"[{truncated_question}] Failed to collect PnL data: {str(e)}")
                 result["pnl_data"] = None
 
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             result["execution_time_seconds"] = duration
 
             self.logger.info(f"✅ [{truncated_question}] Strategy completed in {duration:.2f}s")
@@ -131,8 +134,7 @@ class MarketTask:
             return result
 
         except Exception as e:
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start_time
             result["execution_time_seconds"] = duration
             result["error_message"] = str(e)
             result["action_taken"] = "error"
@@ -148,7 +150,7 @@ class MarketManager:
         self.config = config
         self.w3 = w3
         self.account_address = account_address
-        self.logger = logging.getLogger("FluxorBot")
+        self.logger = logger
 
         # Initialize API client
         self.api_client = AsyncFoilAPIClient(config.foil_api_url)
@@ -159,6 +161,9 @@ class MarketManager:
         # Initialize position manager (shared across all markets)
         self.position_manager = PositionManager(w3, account_address, self.api_client)
 
+        # Contracts shared by all markets on this connection
+        self.contracts = ContractCache(w3)
+
         # Initialize LLM post generator
         self.post_generator = FluxorPostGenerator()
 
@@ -168,6 +173,15 @@ class MarketManager:
         # Market tasks will be populated when run_all_markets is called
         self.market_tasks: List[MarketTask] = []
 
+        # Data of the most recent runs for LLM processing, oldest first
+        self.run_history: deque = deque(maxlen=RUN_HISTORY_SIZE)
+
+        # Market tasks from the previous fetch by (market group, market ID), reused while their API data is unchanged
+        self._tasks_by_key: Dict[Tuple[str, int], MarketTask] = {}
+
+        # Summary posts still being generated or sent in the background
+        self._pending_posts: Set[asyncio.Task] = set()
+
         self.logger.info(
             "MarketManager initialized with shared PositionManager - market tasks will be created dynamically from API"
         )
@@ -191,10 +205,12 @@ class MarketManager:
             market_groups = result.get("marketGroups", [])
             self.logger.info(f"Found {len(market_groups)} market groups from API")
 
-            # Clear existing tasks
+            # Clear existing tasks, keeping the previous fetch's tasks for reuse. Markets no longer listed are dropped
             self.market_tasks.clear()
+            previous_tasks = self._tasks_by_key
+            self._tasks_by_key = {}
 
-            # Create market tasks from API data
+            # Create market tasks from API data. AI predictions are fetched lazily by each live market's strategy
             total_markets = 0
             for market_group in market_groups:
                 group_address = market_group["address"]
@@ -207,22 +223,36 @@ class MarketManager:
 
                 for market_data in markets:
                     try:
-                        task = MarketTask(
-                            market_data=market_data,
-                            market_group_address=group_address,
-                            collateral_asset=collateral_asset,
-                            uniswap_position_manager=uniswap_position_manager,
-                            w3=self.w3,
-                            account_address=self.account_address,
-                            position_manager=self.position_manager,
-                            chain_id=self.config.chain_id,
-                        )
+                        task_key = (group_address, market_data["marketId"])
+                        task = previous_tasks.get(task_key)
+                        if (
+                            task is not None
+                            and task.market_data == market_data
+                            and task.collateral_asset == collateral_asset
+                            and task.uniswap_position_manager == uniswap_position_manager
+                        ):
+                            self.logger.debug(f"Reusing market task: {market_data['marketId']}")
+                            # The prediction belongs to a single run, so it's fetched again
+                            task.foil.reset_ai_prediction()
+                        else:
+                            task = MarketTask(
+                                market_data=market_data,
+                                market_group_address=group_address,
+                                collateral_asset=collateral_asset,
+                                uniswap_position_manager=uniswap_position_manager,
+                                w3=self.w3,
+                                account_address=self.account_address,
+                                position_manager=self.position_manager,
+                                chain_id=self.config.chain_id,
+                                contracts=self.contracts,
+                            )
+                            self.logger.info(
+                                f"✅ Initialized market task: {market_data['marketId']} - "
+                                f"{market_data['question'][:50]}..."
+                            )
+                        self._tasks_by_key[task_key] = task
                         self.market_tasks.append(task)
                         total_markets += 1
-
-                        self.logger.info(
-                            f"✅ Initialized market task: {market_data['marketId']} - {market_data['question'][:50]}..."
-                        )
                     except Exception as e:
                         self.logger.error(
                             f"❌ Failed to initialize market {market_data.get('marketId', 'unknown')}: {str(e)}"
@@ -234,6 +264,12 @@ class MarketManager:
             self.logger.error(f"❌ Failed to fetch market groups from API: {str(e)}")
             raise
 
+    async def close(self) -> None:
+        """Wait for pending summary posts, then close the API client's shared session"""
+        if self._pending_posts:
+            await asyncio.gather(*self._pending_posts, return_exceptions=True)
+        await self.api_client.aclose()
+
     async def run_all_markets(self) -> None:
         """Fetch markets from API and run strategies for all markets concurrently"""
         # First, fetch and initialize market tasks from API
@@ -243,69 +279,108 @@ class MarketManager:
             self.logger.warning("No market tasks to run")
             return
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         self.logger.info(f"🌐 Running strategies for {len(self.market_tasks)} markets")
 
-        # Create async tasks for all markets
-        tasks = []
-        for market_task in self.market_tasks:
-            task = asyncio.create_task(market_task.run_strategy(), name=f"{market_task.market_id}")
-            tasks.append(task)
+        # Positions may have changed since the last run, so query each market group afresh
+        self.position_manager.reset_group_positions()
 
-        # Wait for all tasks to complete and collect results
-        results = await asyncio.gather(*tasks, return_exceptions=False)
+        # Read every market's prices in one Multicall3 round trip; strategies fall back to their own reads on failure
+        try:
+            await prefetch_prices(self.w3, [market_task.foil for market_task in self.market_tasks])
+        except Exception as e:
+            self.logger.warning(f"Failed to prefetch market prices: {str(e)}")
+
+        # Bound in-flight markets so the fan-out doesn't trip the RPC provider's rate limits or queue on the pool
+        semaphore = asyncio.Semaphore(min(self.config.max_concurrent_markets, self.config.rpc_pool_size))
+        market_timeout = self.config.market_timeout_seconds
+
+        async def run_bounded(
+            market_task: MarketTask,
+        ) -> Tuple[MarketTask, Optional[MarketTaskResult], Optional[BaseException]]:
+            async with semaphore:
+                try:
+                    # A hung market times out instead of holding up the whole run
+                    result = await asyncio.wait_for(market_task.run_strategy(), timeout=market_timeout)
+                    return market_task, result, None
+                except asyncio.TimeoutError:
+                    return market_task, None, TimeoutError(f"timed out after {market_timeout:g}s")
+                except Exception as e:
+                    return market_task, None, e
 
-        # Process results and build summary
+        # Create async tasks for all markets
+        tasks = [
+            asyncio.create_task(run_bounded(market_task), name=f"{market_task.market_id}")
+            for market_task in self.market_tasks
+        ]
+
+        # Process results as each market finishes rather than waiting for the slowest
         successful = 0
         failed = 0
         errors = []
         market_summaries = []
 
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
+        for completed, next_result in enumerate(asyncio.as_completed(tasks), start=1):
+            market_task, result, error = await next_result
+
+            if error is not None:
                 failed += 1
-                market_task = self.market_tasks[i]
-                error_msg = f"{market_task.market_id}: {str(result)}"
+                error_msg = f"{market_task.market_id}: {str(error)}"
                 errors.append(error_msg)
-                self.logger.error(f"❌ Market task failed: {error_msg}")
-            else:
-                # Process MarketTaskResult
-                if result["action_taken"] == "error":
-                    failed += 1
-                    errors.append(f"{result['market_id']}: {result['error_message']}")
-                else:
-                    successful += 1
-
-                # Add to market summaries for Discord
-                market_summaries.append(result)
+                self.logger.error(f"❌ Market task failed ({completed}/{len(tasks)}): {error_msg}")
+                continue
 
-        end_time = datetime.now()
-        duration = (end_time - start_time).total_seconds()
+            # Process MarketTaskResult
+            if result["action_taken"] == "error":
+                failed += 1
+                errors.append(f"{result['market_id']}: {result['error_message']}")
+            else:
+                successful += 1
+            self.logger.info(
+                f"Market {market_task.market_id} finished ({completed}/{len(tasks)}): {result['action_taken']}"
+            )
 
-        # Calculate total PnL across all markets
-        total_pnl_susds = 0.0
-        markets_with_pnl = 0
+            # Add to market summaries for Discord
+            market_summaries.append(result)
 
-        for result in market_summaries:
-            if result.get("pnl_data") and result["pnl_data"]["total_pnl_susds"] != 0:
-                total_pnl_susds += result["pnl_data"]["total_pnl_susds"]
-                markets_with_pnl += 1
+        duration = time.perf_counter() - start_time
 
-        # Build comprehensive summary
-        summary_text = self._build_discord_summary(
-            successful, failed, duration, market_summaries, errors, total_pnl_susds, markets_with_pnl
-        )
+        # Store detailed results for future LLM processing, whether or not Discord is enabled
+        markets_by_action, position_totals = self._group_market_results(market_summaries)
+        self._store_run_data(market_summaries, duration, markets_by_action, position_totals)
 
         # Log summary (without Discord formatting)
         log_summary = f"Run Summary - Successful: {successful}, Failed: {failed}, Duration: {duration:.2f}s"
         self.logger.info(log_summary)
 
-        # Send to Discord
-        if self.discord:
+        # Build and send the Discord summary only when Discord is enabled
+        if self.discord.enabled:
+            # Calculate total PnL across all markets
+            total_pnl_susds = 0.0
+            markets_with_pnl = 0
+
+            for result in market_summaries:
+                if result.get("pnl_data") and result["pnl_data"]["total_pnl_susds"] != 0:
+                    total_pnl_susds += result["pnl_data"]["total_pnl_susds"]
+                    markets_with_pnl += 1
+
+            summary_text = self._build_discord_summary(
+                successful,
+                failed,
+                duration,
+                market_summaries,
+                errors,
+                total_pnl_susds,
+                markets_with_pnl,
+                markets_by_action,
+            )
             self.discord.send_message(summary_text)
 
-            # Generate and send Fluxor's quirky summary post
-            await self._generate_and_send_fluxor_post(market_summaries, duration)
+        # Generate and send Fluxor's quirky summary post in the background, it isn't needed for trading.
+        # It also goes to X, so it is sent whether or not Discord is enabled
+        post_task = asyncio.create_task(self._generate_and_send_fluxor_post(market_summaries, duration))
+        self._pending_posts.add(post_task)
+        post_task.add_done_callback(self._pending_posts.discard)
 
     def _build_discord_summary(
         self,
@@ -316,79 +391,93 @@ class MarketManager:
         errors: List[str],
         total_pnl_susds: float,
         markets_with_pnl: int,
+        markets_by_action: Dict[str, List[MarketTaskResult]],
     ) -> str:
         """Build a comprehensive Discord summary of the market run"""
 
         # Header with PnL
-        summary = f"📊 **FluxorBot Run Summary**\n"
-        summary += f"✅ Successful: {successful} | ❌ Failed: {failed} | ⏱️ Duration: {duration:.2f}s\n"
+        parts = ["📊 **FluxorBot Run Summary**\n"]
+        parts.append(f"✅ Successful: {successful} | ❌ Failed: {failed} | ⏱️ Duration: {duration:.2f}s\n")
 
         # Add PnL summary
         if markets_with_pnl > 0:
             pnl_emoji = "💰" if total_pnl_susds >= 0 else "📉"
-            summary += f"{pnl_emoji} **Total PnL: {total_pnl_susds:+.6f} sUSDS** across {markets_with_pnl} markets\n\n"
+            parts.append(
+                f"{pnl_emoji} **Total PnL: {total_pnl_susds:+.6f} sUSDS** across {markets_with_pnl} markets\n\n"
+            )
         else:
-            summary += "💼 No PnL data available\n\n"
+            parts.append("💼 No PnL data available\n\n")
 
         # Add AI Predictions section
-        summary += "🤖 **AI Predictions**\n"
+        parts.append("🤖 **AI Predictions**\n")
         # Sort markets by prediction confidence
         sorted_markets = sorted(market_summaries, key=lambda x: abs(x.get("ai_prediction", 0)), reverse=True)
-        for market in sorted_markets[:5]:  # Show top 5 predictions
+        for market in islice(sorted_markets, 5):  # Show top 5 predictions
             question = truncate_question(market.get("market_question", "Unknown"), 45)
             prediction = market.get("ai_prediction", 0)
             confidence_emoji = "🎯" if abs(prediction) > 70 else "📊"
-            summary += f"• {confidence_emoji} {question}: {prediction:+.1f}%\n"
+            parts.append(f"• {confidence_emoji} {question}: {prediction:+.1f}%\n")
         if len(sorted_markets) > 5:
-            summary += f"... and {len(sorted_markets) - 5} more markets\n"
-        summary += "\n"
+            parts.append(f"... and {len(sorted_markets) - 5} more markets\n")
+        parts.append("\n")
 
-        # Group markets by action taken
-        created_markets = [m for m in market_summaries if m["action_taken"] == "created_positions"]
-        rebalanced_markets = [m for m in market_summaries if m["action_taken"] == "rebalanced"]
-        no_change_markets = [m for m in market_summaries if m["action_taken"] == "no_change"]
+        created_markets = markets_by_action["created_positions"]
+        rebalanced_markets = markets_by_action["rebalanced"]
+        no_change_markets = markets_by_action["no_change"]
 
         # Position creation summary
         if created_markets:
             total_created = sum(m["positions_created"] for m in created_markets)
-            summary += f"🆕 **New Positions Created** ({len(created_markets)} markets, {total_created} positions)\n"
-            for market in created_markets[:3]:  # Show first 3
+            parts.append(f"🆕 **New Positions Created** ({len(created_markets)} markets, {total_created} positions)\n")
+            for market in islice(created_markets, 3):  # Show first 3
+                positions_created, prediction = _created_row(market)
                 pnl_text = ""
                 if market.get("pnl_data") and market["pnl_data"]["total_pnl_susds"] != 0:
                     pnl_susds = market["pnl_data"]["total_pnl_susds"]
                     pnl_text = f", PnL: {pnl_susds:+.4f} sUSDS"
 
                 question = truncate_question(market.get("market_question", "Unknown"), 45)
-                summary += f"• {question}: {market['positions_created']} pos, {market['ai_prediction']:.1f}% prediction{pnl_text}\n"
+                parts.append(f"• {question}: {positions_created} pos, {prediction:.1f}% prediction{pnl_text}\n")
             if len(created_markets) > 3:
-                summary += f"... and {len(created_markets) - 3} more\n"
-            summary += "\n"
+                parts.append(f"... and {len(created_markets) - 3} more\n")
+            parts.append("\n")
 
         # Rebalancing summary
         if rebalanced_markets:
             total_closed = sum(m["positions_closed"] for m in rebalanced_markets)
             total_created = sum(m["positions_created"] for m in rebalanced_markets)
-            summary += f"🔄 **Rebalanced** ({len(rebalanced_markets)} markets, {total_closed} closed, {total_created} created)\n"
-            for market in rebalanced_markets[:3]:  # Show first 3
+            parts.append(
+                f"🔄 **Rebalanced** ({len(rebalanced_markets)} markets, "
+                f"{total_closed} closed, {total_created} created)\n"
+            )
+            for market in islice(rebalanced_markets, 3):  # Show first 3
+                positions_closed, positions_created, prediction = _rebalanced_row(market)
                 pnl_text = ""
                 if market.get("pnl_data") and market["pnl_data"]["total_pnl_susds"] != 0:
                     pnl_susds = market["pnl_data"]["total_pnl_susds"]
                     pnl_text = f", PnL: {pnl_susds:+.4f} sUSDS"
 
                 question = truncate_question(market.get("market_question", "Unknown"), 45)
-                summary += f"• {question}: {market['positions_closed']}→{market['positions_created']}, {market['ai_prediction']:.1f}% prediction{pnl_text}\n"
+                parts.append(
+                    f"• {question}: {positions_closed}→{positions_created}, "
+                    f"{prediction:.1f}% prediction{pnl_text}\n"
+                )
             if len(rebalanced_markets) > 3:
-                summary += f"... and {len(rebalanced_markets) - 3} more\n"
-            summary += "\n"
+                parts.append(f"... and {len(rebalanced_markets) - 3} more\n")
+            parts.append("\n")
 
         # No change summary
         if no_change_markets:
-            summary += f"✅ **No Changes** ({len(no_change_markets)} markets kept existing positions)\n\n"
+            parts.append(f"✅ **No Changes** ({len(no_change_markets)} markets kept existing positions)\n\n")
 
         # Error summary
         if errors:
-            summary += f"❌ **Errors** ({len(errors)})\n"
-            for error in errors[:3]:  # Show first 3 errors
+            parts.append(f"❌ **Errors** ({len(errors)})\n")
+            # Index market questions by ID once for the error lines
+            questions_by_id: Dict[int, str] = {}
+            for m in market_summaries:
+                questions_by_id.setdefault(m["market_id"], m.get("market_question", "Unknown"))
+            for error in islice(errors, 3):  # Show first 3 errors
                 # Extract market info from error and replace with question if possible
                 error_parts = error.split(": ", 1)
                 if len(error_parts) == 2:
@@ -397,54 +486,78 @@ class MarketManager:
                     # Try to find the market question from market_summaries
                     market_question = "Unknown"
                     try:
-                        market_id = int(market_id_str)
-                        for market in market_summaries:
-                            if market["market_id"] == market_id:
-                                market_question = market.get("market_question", "Unknown")
-                                break
+                        market_question = questions_by_id.get(int(market_id_str), "Unknown")
                     except ValueError:
                         pass
 
                     question = truncate_question(market_question, 40)
-                    summary += f"• {question}: {error_msg}\n"
+                    parts.append(f"• {question}: {error_msg}\n")
                 else:
-                    summary += f"• {error}\n"
+                    parts.append(f"• {error}\n")
             if len(errors) > 3:
-                summary += f"... and {len(errors) - 3} more errors\n"
-
-        # Store detailed results for future LLM processing
-        self._store_run_data(market_summaries, duration)
-
-        return summary
-
-    def _store_run_data(self, market_summaries: List[MarketTaskResult], duration: float) -> None:
-        """Store run data for future LLM tweet generation"""
+                parts.append(f"... and {len(errors) - 3} more errors\n")
+
+        return "".join(parts)
+
+    def _group_market_results(
+        self, market_summaries: List[MarketTaskResult]
+    ) -> Tuple[Dict[str, List[MarketTaskResult]], Counter]:
+        """
+        Group market results by action taken and total their positions in a single pass
+
+        Args:
+            market_summaries: Results of every market in the run
+
+        Returns:
+            Tuple of (market results by action taken, Counter of positions "created" and "closed")
+        """
+        markets_by_action: Dict[str, List[MarketTaskResult]] = {
+            "created_positions": [],
+            "rebalanced": [],
+            "no_change": [],
+            "error": [],
+        }
+        position_totals: Counter = Counter()
+        for m in market_summaries:
+            markets_by_action.setdefault(m["action_taken"], []).append(m)
+            position_totals["created"] += m["positions_created"]
+            position_totals["closed"] += m["positions_closed"]
+        return markets_by_action, position_totals
+
+    def _store_run_data(
+        self,
+        market_summaries: List[MarketTaskResult],
+        duration: float,
+        markets_by_action: Dict[str, List[MarketTaskResult]],
+        position_totals: Counter,
+    ) -> None:
+        """
+        Store run data for future LLM tweet generation
+
+        Args:
+            market_summaries: Results of every market in the run
+            duration: Run duration in seconds
+            markets_by_action: Market results grouped by action taken
+            position_totals: Positions "created" and "closed" across all markets
+        """
         run_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
             "duration_seconds": duration,
             "total_markets": len(market_summaries),
             "market_results": market_summaries,
             "summary_stats": {
-                "created_positions": sum(m["positions_created"] for m in market_summaries),
-                "closed_positions": sum(m["positions_closed"] for m in market_summaries),
-                "markets_with_new_positions": len(
-                    [m for m in market_summaries if m["action_taken"] == "created_positions"]
-                ),
-                "markets_rebalanced": len([m for m in market_summaries if m["action_taken"] == "rebalanced"]),
-                "markets_no_change": len([m for m in market_summaries if m["action_taken"] == "no_change"]),
-                "errors": len([m for m in market_summaries if m["action_taken"] == "error"]),
+                "created_positions": position_totals["created"],
+                "closed_positions": position_totals["closed"],
+                "markets_with_new_positions": len(markets_by_action["created_positions"]),
+                "markets_rebalanced": len(markets_by_action["rebalanced"]),
+                "markets_no_change": len(markets_by_action["no_change"]),
+                "errors": len(markets_by_action["error"]),
             },
         }
 
-        # Store in instance variable for now (could be saved to file/DB later)
-        if not hasattr(self, "run_history"):
-            self.run_history = []
+        # Store in instance variable for now (could be saved to file/DB later); the deque drops the oldest runs
         self.run_history.append(run_data)
 
-        # Keep only last 100 runs to avoid memory issues
-        if len(self.run_history) > 100:
-            self.run_history = self.run_history[-100:]
-
         self.logger.info(f"Stored run data: {len(market_summaries)} markets, {run_data['summary_stats']}")
 
     async def _generate_and_send_fluxor_post(self, market_summaries: List[MarketTaskResult], duration: float) -> None:
@@ -473,7 +586,8 @@ class MarketManager:
             # Also post to X if enabled
             if self.x_client.is_enabled():
                 self.logger.info("Posting Fluxor summary to X...")
-                x_success = self.x_client.post_fluxor_summary(fluxor_post)
+                # The X client is blocking, so post off the event loop
+                x_success = await asyncio.to_thread(self.x_client.post_fluxor_summary, fluxor_post)
                 if x_success:
                     self.logger.info("✅ Fluxor summary posted to X successfully")
                 else:
@@ -486,15 +600,14 @@ class MarketManager:
 
     def get_latest_run_data(self) -> Optional[Dict]:
         """Get the latest run data for LLM processing"""
-        if hasattr(self, "run_history") and self.run_history:
+        if self.run_history:
             return self.run_history[-1]
         return None
 
     def get_run_history(self, limit: int = 10) -> List[Dict]:
         """Get recent run history for LLM processing"""
-        if not hasattr(self, "run_history"):
-            return []
-        return self.run_history[-limit:] if limit > 0 else self.run_history
+        history = list(self.run_history)
+        return history[-limit:] if limit > 0 else history
 
     def get_market_count(self) -> int:
         """Get total number of markets being managed"""
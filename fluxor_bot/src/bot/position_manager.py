@@ -4,15 +4,25 @@ Position Manager for handling multiple positions via API queries
 
 import asyncio
 import logging
-from typing import Any, Dict, List, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
 
 from web3 import Web3
 
+from shared.abis import MULTICALL3_ABI, MULTICALL3_ADDRESS
 from shared.clients.async_api_client import AsyncFoilAPIClient
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.web3_utils import send_transaction, simulate_transaction, tick_to_sqrt_price_x96
+from shared.utils.async_web3_utils import (
+    TransactionConfig,
+    decode_contract_result,
+    encode_contract_call,
+    multicall_async,
+    send_async_transaction,
+    simulate_async_transaction,
+)
+from shared.utils.web3_utils import BASE_CHAIN_ID, tick_to_sqrt_price_x96
 
 from .config import BotConfig
+from .foil import get_head_timestamp
 
 
 class PositionData(TypedDict):
@@ -54,21 +64,40 @@ class PositionManager:
         # Add a lock to prevent concurrent API calls
         self._api_lock = asyncio.Lock()
 
-    async def load_positions_for_market(
-        self, market_address: str, market_id: int, chain_id: int, foil_contract, market_params: Dict
-    ) -> List[PositionData]:
+        # API position queries by (market group address, chain ID) for the current run
+        self._group_positions: Dict[Tuple[str, int], asyncio.Future] = {}
+
+        # Deposit and quote amounts in wei are the same for every position, so compute them once
+        self._deposit_amount = int(BotConfig.get_config().collateral_size * 10**18)
+        self._quote_amount = self._deposit_amount - int(1e6)  # Subtract 1 million wei for quote precision
+
+        # Known allowances by (collateral asset, spender) after this bot's approvals and creations, with a lock per key
+        self._allowances: Dict[Tuple[str, str], int] = {}
+        self._allowance_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+        # Multicall3 also serves the block timestamp, so it can be read in the same batch as contract state
+        self.multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+
+    def _tx_config(self, **overrides: Any) -> TransactionConfig:
+        """Build transaction settings, using higher gas pricing on Base mainnet"""
+        tx_config: TransactionConfig = {}
+        if BotConfig.get_config().chain_id == BASE_CHAIN_ID:
+            # Base mainnet often needs higher priority fees
+            tx_config["min_priority_fee"] = int(0.001 * 10**9)  # Minimum 0.001 gwei
+            tx_config["max_fee_per_gas_multiplier"] = 3  # Larger buffer for Base
+        tx_config.update(overrides)
+        return tx_config
+
+    async def _query_group_positions(self, market_address: str, chain_id: int) -> List[Dict[str, Any]]:
         """
-        Load all positions for a specific market using GraphQL query and get tick data from Uniswap position manager
+        Query the account's positions in a market group from the API
 
         Args:
-            market_address: The market contract address
-            market_id: The specific market ID to filter by
+            market_address: The market group contract address
             chain_id: The blockchain chain ID
-            foil_contract: The Foil contract instance
-            market_params: Market parameters including uniswap position manager
 
         Returns:
-            List of active LP positions for the specified market with correct tick data from Uniswap
+            Raw API positions for every market in the group
         """
         query = """
         query GetUserPositions($marketAddress: String, $owner: String, $chainId: Int) {
@@ -90,112 +119,152 @@ class PositionManager:
 
         # Use lock to prevent concurrent API access
         async with self._api_lock:
-            try:
-                self.logger.info(f"[Market {market_id}] Loading positions from API...")
-                self.logger.info(
-                    f"Query variables: marketAddress={market_address}, owner={self.account_address}, chainId={chain_id}"
-                )
-
-                # Execute GraphQL query with retry logic
-                max_retries = 3
-                for attempt in range(max_retries):
-                    try:
-                        result = await self.api_client.query_async(query, variables)
-                        break
-                    except Exception as e:
-                        if "Transport is already connected" in str(e) and attempt < max_retries - 1:
-                            self.logger.warning(
-                                f"[Market {market_id}] Transport connection issue, retrying... (attempt {attempt + 1}/{max_retries})"
-                            )
-                            await asyncio.sleep(0.5)  # Short delay before retry
-                            continue
-                        else:
-                            raise
-
-                raw_positions = result.get("positions", [])
-
-                self.logger.info(f"[Market {market_id}] Found {len(raw_positions)} total positions from API")
-
-                # Filter and convert positions
-                filtered_positions = []
-
-                for pos in raw_positions:
-                    # Filter by market ID
-                    if pos["market"]["marketId"] != market_id:
-                        continue
+            self.logger.info(f"Loading positions from API for market group {market_address}...")
+            self.logger.info(
+                f"Query variables: marketAddress={market_address}, owner={self.account_address}, chainId={chain_id}"
+            )
 
-                    # Filter to only LP positions
-                    if not pos["isLP"]:
+            # Execute GraphQL query with retry logic
+            max_retries = 3
+            for attempt in range(max_retries):
+                try:
+                    result = await self.api_client.query_async(query, variables)
+                    break
+                except Exception as e:
+                    if "Transport is already connected" in str(e) and attempt < max_retries - 1:
+                        self.logger.warning(
+                            f"[Group {market_address}] Transport connection issue, retrying... "
+                            f"(attempt {attempt + 1}/{max_retries})"
+                        )
+                        await asyncio.sleep(0.5)  # Short delay before retry
                         continue
+                    else:
+                        raise
+
+        return result.get("positions", [])
+
+    async def _get_group_positions(self, market_address: str, chain_id: int) -> List[Dict[str, Any]]:
+        """Get the account's API positions in a market group, querying each group only once per run"""
+        key = (market_address, chain_id)
+        task = self._group_positions.get(key)
+        if task is None:
+            # Markets of the same group await the same query instead of repeating it
+            task = asyncio.ensure_future(self._query_group_positions(market_address, chain_id))
+            self._group_positions[key] = task
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            # Let the next market of the group retry a failed query
+            if self._group_positions.get(key) is task:
+                del self._group_positions[key]
+            raise
 
-                    # Filter to only active positions (both tokens > 0 means position is active)
-                    if pos["lpBaseToken"] == 0 and pos["lpQuoteToken"] == 0:
-                        self.logger.debug(f"[Market {market_id}] Skipping closed position {pos['positionId']}")
-                        continue
+    def reset_group_positions(self) -> None:
+        """Forget the API positions loaded for market groups, so the next run queries them again"""
+        self._group_positions.clear()
 
-                    # Filter out settled positions
-                    if pos["isSettled"]:
-                        self.logger.debug(f"[Market {market_id}] Skipping settled position {pos['positionId']}")
-                        continue
+    async def load_positions_for_market(
+        self, market_address: str, market_id: int, chain_id: int, foil_contract, market_params: Dict
+    ) -> List[PositionData]:
+        """
+        Load all positions for a specific market using GraphQL query and get tick data from Uniswap position manager
 
-                    # Get position details from Foil contract to get uniswap position ID
-                    try:
-                        position_id = pos["positionId"]
-                        (_, kind, _, collateral_amount, _, _, _, _, uniswap_position_id, _) = (
-                            foil_contract.functions.getPosition(position_id).call()
-                        )
+        The API positions of a market group are queried once per run and shared by the group's markets.
 
-                        # Get tick information from Uniswap position manager
-                        if kind == 1 and uniswap_position_id > 0:  # LP position
-                            position_data = (
-                                market_params["uniswap_position_manager"]
-                                .functions.positions(uniswap_position_id)
-                                .call()
-                            )
-                            (_, _, _, _, _, tick_lower, tick_upper, liquidity, _, _, _, _) = position_data
-                        else:
-                            # Not an LP position or invalid uniswap position ID
-                            self.logger.debug(
-                                f"[Market {market_id}] Skipping non-LP position {position_id} (kind={kind})"
-                            )
-                            continue
-
-                        # Convert to our PositionData format
-                        position_data: PositionData = {
-                            "market_id": pos["market"]["marketId"],
-                            "position_id": position_id,
-                            "is_lp": pos["isLP"],
-                            "collateral": pos["collateral"],
-                            "is_settled": pos["isSettled"],
-                            "low_price_tick": tick_lower,
-                            "high_price_tick": tick_upper,
-                            "lp_base_token": pos["lpBaseToken"],
-                            "lp_quote_token": pos["lpQuoteToken"],
-                            "liquidity": liquidity,
-                        }
-
-                        filtered_positions.append(position_data)
-                        self.logger.info(
-                            f"[Market {market_id}] Active LP position found: ID={position_id}, "
-                            f"Ticks={tick_lower}-{tick_upper} (from Uniswap), "
-                            f"Base={pos['lpBaseToken']}, Quote={pos['lpQuoteToken']}"
-                        )
+        Args:
+            market_address: The market contract address
+            market_id: The specific market ID to filter by
+            chain_id: The blockchain chain ID
+            foil_contract: The Foil contract instance
+            market_params: Market parameters including uniswap position manager
 
-                    except Exception as e:
-                        self.logger.warning(
-                            f"[Market {market_id}] Failed to get tick data for position {pos['positionId']}: {str(e)}"
+        Returns:
+            List of active LP positions for the specified market with correct tick data from Uniswap
+        """
+        try:
+            self.logger.info(f"[Market {market_id}] Loading positions from API...")
+            raw_positions = await self._get_group_positions(market_address, chain_id)
+
+            self.logger.info(f"[Market {market_id}] Found {len(raw_positions)} total positions from API")
+
+            # Filter and convert positions
+            filtered_positions = []
+
+            for pos in raw_positions:
+                # Filter by market ID
+                if pos["market"]["marketId"] != market_id:
+                    continue
+
+                # Filter to only LP positions
+                if not pos["isLP"]:
+                    continue
+
+                # Filter to only active positions (both tokens > 0 means position is active)
+                if pos["lpBaseToken"] == 0 and pos["lpQuoteToken"] == 0:
+                    self.logger.debug(f"[Market {market_id}] Skipping closed position {pos['positionId']}")
+                    continue
+
+                # Filter out settled positions
+                if pos["isSettled"]:
+                    self.logger.debug(f"[Market {market_id}] Skipping settled position {pos['positionId']}")
+                    continue
+
+                # Get position details from Foil contract to get uniswap position ID
+                try:
+                    position_id = pos["positionId"]
+                    (_, kind, _, collateral_amount, _, _, _, _, uniswap_position_id, _) = (
+                        await foil_contract.functions.getPosition(position_id).call()
+                    )
+
+                    # Get tick information from Uniswap position manager
+                    if kind == 1 and uniswap_position_id > 0:  # LP position
+                        position_data = (
+                            await market_params["uniswap_position_manager"]
+                            .functions.positions(uniswap_position_id)
+                            .call()
                         )
+                        (_, _, _, _, _, tick_lower, tick_upper, liquidity, _, _, _, _) = position_data
+                    else:
+                        # Not an LP position or invalid uniswap position ID
+                        self.logger.debug(f"[Market {market_id}] Skipping non-LP position {position_id} (kind={kind})")
                         continue
 
-                # Store positions for this market
-                self.positions_by_market[market_id] = filtered_positions
+                    # Convert to our PositionData format
+                    position_data: PositionData = {
+                        "market_id": pos["market"]["marketId"],
+                        "position_id": position_id,
+                        "is_lp": pos["isLP"],
+                        "collateral": pos["collateral"],
+                        "is_settled": pos["isSettled"],
+                        "low_price_tick": tick_lower,
+                        "high_price_tick": tick_upper,
+                        "lp_base_token": pos["lpBaseToken"],
+                        "lp_quote_token": pos["lpQuoteToken"],
+                        "liquidity": liquidity,
+                    }
 
-                self.logger.info(f"[Market {market_id}] Loaded {len(filtered_positions)} active LP positions")
-                return filtered_positions
+                    filtered_positions.append(position_data)
+                    self.logger.info(
+                        f"[Market {market_id}] Active LP position found: ID={position_id}, "
+                        f"Ticks={tick_lower}-{tick_upper} (from Uniswap), "
+                        f"Base={pos['lpBaseToken']}, Quote={pos['lpQuoteToken']}"
+                    )
 
-            except Exception as e:
-                self.logger.error(f"[Market {market_id}] Failed to load positions: {str(e)}")
-                raise
+                except Exception as e:
+                    self.logger.warning(
+                        f"[Market {market_id}] Failed to get tick data for position {pos['positionId']}: {str(e)}"
+                    )
+                    continue
+
+            # Store positions for this market
+            self.positions_by_market[market_id] = filtered_positions
+
+            self.logger.info(f"[Market {market_id}] Loaded {len(filtered_positions)} active LP positions")
+            return filtered_positions
+
+        except Exception as e:
+            self.logger.error(f"[Market {market_id}] Failed to load positions: {str(e)}")
+            raise
 
     def get_positions_for_market(self, market_id: int) -> List[PositionData]:
         """Get loaded positions for a specific market"""
@@ -240,7 +309,7 @@ class PositionManager:
             position_id = position_data["position_id"]
             try:
                 # Call getPositionPnl on the Foil contract
-                pnl_wei = foil_contract.functions.getPositionPnl(position_id).call()
+                pnl_wei = await foil_contract.functions.getPositionPnl(position_id).call()
                 pnl_susds = self.w3.from_wei(pnl_wei, "ether")  # sUSDS has 18 decimals like ETH
 
                 # Update position data with PnL
@@ -286,28 +355,37 @@ class PositionManager:
         sqrt_price_x96_lower = tick_to_sqrt_price_x96(new_lower)
         sqrt_price_x96_upper = tick_to_sqrt_price_x96(new_upper)
 
-        # Get current price from the contract
-        sqrt_price_x96_current = foil_contract.functions.getSqrtPriceX96(market_id).call()
-
-        # Get user's collateral balance
-        collateral_balance = market_params["collateral_asset"].functions.balanceOf(self.account_address).call()
+        # Get the current price, collateral balance, allowance and block timestamp in a single Multicall3 round trip
+        collateral_asset = market_params["collateral_asset"]
+        calls = [
+            encode_contract_call(foil_contract, "getSqrtPriceX96", market_id),
+            encode_contract_call(collateral_asset, "balanceOf", self.account_address),
+            encode_contract_call(collateral_asset, "allowance", self.account_address, foil_contract.address),
+            encode_contract_call(self.multicall, "getCurrentBlockTimestamp"),
+        ]
+        (_, price_data), (_, balance_data), (_, allowance_data), (_, timestamp_data) = await multicall_async(
+            self.w3, calls
+        )
+        sqrt_price_x96_current = decode_contract_result(self.w3, foil_contract, "getSqrtPriceX96", price_data)
+        collateral_balance = decode_contract_result(self.w3, collateral_asset, "balanceOf", balance_data)
+        current_allowance = decode_contract_result(self.w3, collateral_asset, "allowance", allowance_data)
+        current_time = decode_contract_result(self.w3, self.multicall, "getCurrentBlockTimestamp", timestamp_data)
 
-        # Use configured position size (convert to wei)
-        config = BotConfig.get_config()
-        deposit_amount = int(config.collateral_size * 10**18)
+        # Use configured position size in wei
+        deposit_amount = self._deposit_amount
 
         # Check if we have sufficient balance
         if collateral_balance < deposit_amount:
             raise ValueError(f"Insufficient balance. Required: {deposit_amount}, Available: {collateral_balance}")
 
         # Quote required token amounts for liquidity (use slightly less amount for quote precision)
-        quote_amount = deposit_amount - int(1e6)  # Subtract 1 million wei for quote
-        (token0_amount, token1_amount, _) = foil_contract.functions.quoteLiquidityPositionTokens(
+        quote_amount = self._quote_amount
+        (token0_amount, token1_amount, _) = await foil_contract.functions.quoteLiquidityPositionTokens(
             int(epoch_data["epoch_id"]),
-            int(quote_amount),
-            int(sqrt_price_x96_current),
-            int(sqrt_price_x96_lower),
-            int(sqrt_price_x96_upper),
+            quote_amount,
+            sqrt_price_x96_current,
+            sqrt_price_x96_lower,
+            sqrt_price_x96_upper,
         ).call()
 
         self.logger.info(
@@ -315,82 +393,98 @@ class PositionManager:
             f"Token0: {token0_amount}, Token1: {token1_amount}"
         )
 
-        # Check current allowance before approving
-        current_allowance = (
-            market_params["collateral_asset"].functions.allowance(self.account_address, foil_contract.address).call()
-        )
-
-        self.logger.info(f"[Market {market_id}] Current allowance: {current_allowance}, Required: {quote_amount}")
-
-        # Only approve if current allowance is insufficient
-        if current_allowance < deposit_amount:
-            self.logger.info(f"[Market {market_id}] Insufficient allowance, approving collateral spending...")
-            send_transaction(
-                self.w3,
-                market_params["collateral_asset"].functions.approve,
-                self.account_address,
-                BotConfig.get_config().wallet_pk,
-                self.logger,
-                "FluxorBot: Approve Collateral",
-                foil_contract.address,
-                int(deposit_amount),
+        # Approvals and creations against the same collateral and spender run one at a time, so a sibling market's
+        # approve can't overwrite allowance another market is about to spend
+        allowance_key = (collateral_asset.address, foil_contract.address)
+        allowance_lock = self._allowance_locks.setdefault(allowance_key, asyncio.Lock())
+        async with allowance_lock:
+            # Allowance left by a sibling market's approve or create is newer than the batched read
+            current_allowance = self._allowances.get(allowance_key, current_allowance)
+            self.logger.info(f"[Market {market_id}] Current allowance: {current_allowance}, Required: {quote_amount}")
+
+            # Only approve if current allowance is insufficient
+            if current_allowance < deposit_amount:
+                self.logger.info(f"[Market {market_id}] Insufficient allowance, approving collateral spending...")
+                try:
+                    await send_async_transaction(
+                        self.w3,
+                        collateral_asset.functions.approve,
+                        self.account_address,
+                        BotConfig.get_config().wallet_pk,
+                        self.logger,
+                        "FluxorBot: Approve Collateral",
+                        foil_contract.address,
+                        deposit_amount,
+                        tx_config=self._tx_config(),
+                        poll_latency=2,
+                    )
+                except Exception:
+                    # The on-chain allowance is unknown after a failed approve
+                    self._allowances.pop(allowance_key, None)
+                    raise
+                current_allowance = deposit_amount
+            else:
+                self.logger.info(f"[Market {market_id}] Sufficient allowance already exists, skipping approval")
+
+            # Add 30 minutes to the batched block timestamp for deadline
+            deadline = current_time + (30 * 60)
+
+            # Create position parameters struct as tuple
+            position_params = (
+                int(epoch_data["epoch_id"]),  # epochId: uint256
+                token0_amount,  # amountTokenA: uint256
+                token1_amount,  # amountTokenB: uint256
+                deposit_amount,  # collateralAmount: uint256
+                int(new_lower),  # lowerTick: int24
+                int(new_upper),  # upperTick: int24
+                0,  # minAmountTokenA: uint256
+                0,  # minAmountTokenB: uint256
+                deadline,  # deadline: uint256
             )
-        else:
-            self.logger.info(f"[Market {market_id}] Sufficient allowance already exists, skipping approval")
-
-        # Get current timestamp and add 30 minutes for deadline
-        current_block = self.w3.eth.get_block("latest")
-        deadline = current_block.timestamp + (30 * 60)
-
-        # Create position parameters struct as tuple
-        position_params = (
-            int(epoch_data["epoch_id"]),  # epochId: uint256
-            int(token0_amount),  # amountTokenA: uint256
-            int(token1_amount),  # amountTokenB: uint256
-            int(deposit_amount),  # collateralAmount: uint256
-            int(new_lower),  # lowerTick: int24
-            int(new_upper),  # upperTick: int24
-            0,  # minAmountTokenA: uint256
-            0,  # minAmountTokenB: uint256
-            int(deadline),  # deadline: uint256
-        )
 
-        try:
-            # Simulate the transaction first to catch any issues
-            self.logger.info(f"[Market {market_id}] Simulating liquidity position creation...")
-            simulation = simulate_transaction(
-                self.w3,
-                foil_contract.functions.createLiquidityPosition,
-                self.account_address,
-                self.logger,
-                position_params,
-            )
+            try:
+                # Simulate the transaction first to catch any issues
+                self.logger.info(f"[Market {market_id}] Simulating liquidity position creation...")
+                simulation = await simulate_async_transaction(
+                    self.w3,
+                    foil_contract.functions.createLiquidityPosition,
+                    self.account_address,
+                    self.logger,
+                    position_params,
+                )
 
-            if not simulation["success"]:
-                raise ValueError(f"Transaction simulation failed: {simulation['error']}")
-
-            self.logger.info(f"[Market {market_id}] Simulation successful. Estimated gas: {simulation['gas_estimate']}")
-
-            # Send transaction with higher gas and shorter timeout for Base mainnet
-            self.logger.info(f"[Market {market_id}] Sending liquidity position creation transaction...")
-            send_transaction(
-                self.w3,
-                foil_contract.functions.createLiquidityPosition,
-                self.account_address,
-                BotConfig.get_config().wallet_pk,
-                self.logger,
-                "FluxorBot: Create Liquidity Position",
-                position_params,
-                gas_multiplier=1.5,  # Use 150% of estimated gas instead of 120%
-                timeout=60,  # Reduce timeout to 1 minute to avoid hanging
-                poll_latency=3,  # Check every 3 seconds
-            )
+                if not simulation["success"]:
+                    raise ValueError(f"Transaction simulation failed: {simulation['error']}")
+
+                self.logger.info(
+                    f"[Market {market_id}] Simulation successful. Estimated gas: {simulation['gas_estimate']}"
+                )
 
-            self.logger.info(f"✅ [Market {market_id}] Position created successfully!")
+                # Send transaction with higher gas and shorter timeout for Base mainnet
+                self.logger.info(f"[Market {market_id}] Sending liquidity position creation transaction...")
+                await send_async_transaction(
+                    self.w3,
+                    foil_contract.functions.createLiquidityPosition,
+                    self.account_address,
+                    BotConfig.get_config().wallet_pk,
+                    self.logger,
+                    "FluxorBot: Create Liquidity Position",
+                    position_params,
+                    tx_config=self._tx_config(gas_limit_multiplier=1.5),  # Use 150% of estimated gas instead of 120%
+                    timeout=60,  # Reduce timeout to 1 minute to avoid hanging
+                    poll_latency=3,  # Check every 3 seconds
+                )
 
-        except Exception as e:
-            self.logger.error(f"[Market {market_id}] Failed to create liquidity position: {str(e)}")
-            raise
+                self.logger.info(f"✅ [Market {market_id}] Position created successfully!")
+
+                # Creating the position spends the deposit from the allowance
+                self._allowances[allowance_key] = current_allowance - deposit_amount
+
+            except Exception as e:
+                # Whether the allowance was spent is unknown, so the next position reads it again
+                self._allowances.pop(allowance_key, None)
+                self.logger.error(f"[Market {market_id}] Failed to create liquidity position: {str(e)}")
+                raise
 
     async def close_lp_position(self, position_id: int, liquidity: int, foil_contract, market_id: int) -> bool:
         """
@@ -405,7 +499,8 @@ class PositionManager:
         Returns:
             True if position transitioned to trader, False if fully closed
         """
-        current_time = self.w3.eth.get_block("latest").timestamp
+        # Markets close positions at about the same time, so they share one head timestamp
+        current_time = await get_head_timestamp(self.w3)
         deadline = current_time + (30 * 60)  # 30 minutes from now
 
         # Create decrease liquidity params struct as tuple
@@ -421,7 +516,7 @@ class PositionManager:
         self.logger.info(
             f"[Market {market_id}] Simulating decrease liquidity transaction for position {position_id}..."
         )
-        simulation_result = simulate_transaction(
+        simulation_result = await simulate_async_transaction(
             self.w3,
             foil_contract.functions.decreaseLiquidityPosition,
             self.account_address,
@@ -441,7 +536,7 @@ class PositionManager:
         )
 
         # Send the actual transaction
-        send_transaction(
+        await send_async_transaction(
             self.w3,
             foil_contract.functions.decreaseLiquidityPosition,
             self.account_address,
@@ -449,6 +544,8 @@ class PositionManager:
             self.logger,
             "FluxorBot: Decrease Liquidity",
             decrease_params,
+            tx_config=self._tx_config(),
+            poll_latency=2,
         )
 
         self.logger.info(f"[Market {market_id}] LP Position {position_id} successfully closed")
@@ -465,11 +562,11 @@ class PositionManager:
             foil_contract: The Foil contract instance
             market_id: Market ID for logging
         """
-        current_time = self.w3.eth.get_block("latest").timestamp
+        current_time = await get_head_timestamp(self.w3)
         deadline = current_time + (30 * 60)
 
         # Send modify trader position transaction
-        send_transaction(
+        await send_async_transaction(
             self.w3,
             foil_contract.functions.modifyTraderPosition,
             self.account_address,
@@ -480,6 +577,8 @@ class PositionManager:
             0,  # size
             0,  # deltaCollateralLimit
             deadline,  # deadline
+            tx_config=self._tx_config(),
+            poll_latency=2,
         )
 
         self.logger.info(f"[Market {market_id}] Trader Position {position_id} successfully closed")
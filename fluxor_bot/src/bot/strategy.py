@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import time
 from typing import Dict, Optional
@@ -7,17 +8,10 @@ from shared.utils.web3_utils import price_to_tick, tick_to_price
 from .config import BotConfig
 from .foil import Foil
 from .position_manager import PositionManager
+from .utils import truncate_question
 
-
-def truncate_question(question: str, max_length: int = 40) -> str:
-    """Helper function to truncate market questions for display"""
-    if not question or question == "Unknown":
-        return "Unknown question"
-
-    if len(question) <= max_length:
-        return question
-
-    return question[: max_length - 3] + "..."
+# Shared by every market rather than looked up per instance
+logger = logging.getLogger("FluxorBot")
 
 
 class FluxorStrategy:
@@ -25,7 +19,7 @@ class FluxorStrategy:
         self.position_manager = position_manager
         self.foil = foil
         self.account_address = account_address
-        self.logger = logging.getLogger("FluxorBot")
+        self.logger = logger
         self.config = BotConfig.get_config()
 
     async def run(self) -> Dict:
@@ -44,12 +38,12 @@ class FluxorStrategy:
         }
 
         # Check if market is live
-        if not self.foil.is_live():
+        if not await self.foil.is_live():
             self.logger.warning(f"[{question_display}] Market epoch is not live, skipping strategy execution")
             return result
 
-        # Get current price
-        current_price_d18 = self.foil.get_current_price_d18()
+        # Get current price and the AI prediction, which is only fetched now that the market is known to be live
+        current_price_d18, _ = await asyncio.gather(self.foil.get_current_price_d18(), self.foil.get_ai_prediction())
         current_price = self.foil.w3.from_wei(current_price_d18, "ether")
 
         self.logger.info(f"[{question_display}] Current market price: {current_price}")
@@ -0,0 +1,6 @@
+def truncate_question(question: str, max_length: int = 50) -> str:
+    """Helper function to truncate market questions for display"""
+    if not question or question == "Unknown":
+        return "Unknown question"
+
+    return question if len(question) <= max_length else f"{question[: max_length - 3]}..."
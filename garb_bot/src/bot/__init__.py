@@ -4,11 +4,13 @@ Arbitrage Bot - A bot for cryptocurrency arbitrage on the foil contract.
 
 import asyncio
 import logging
+import time
 from datetime import datetime
 from decimal import Decimal
 
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.async_web3_utils import create_async_web3_provider
+from shared.utils.async_web3_utils import create_async_web3_provider, create_async_websocket_web3_provider
+from shared.utils.schedule import retry_backoff, sleep_until_next_run
 
 from .api_client import GarbApiClient
 from .arb import ArbitrageLogic
@@ -41,6 +43,9 @@ class ArbitrageBot:
         self.arb_logic = None
         self.api_client = None
 
+        # Consecutive failed runs, used for retry backoff
+        self._fail_count = 0
+
         self.logger.info("Arbitrage Bot initialization complete")
         self.discord.send_message("🤖 Arbitrage Bot initialized and ready!")
 
@@ -64,9 +69,25 @@ class ArbitrageBot:
 
         return logger
 
+    async def _create_web3(self):
+        """Connect over WebSocket when configured, falling back to HTTP"""
+        if self.config.rpc_ws_url:
+            try:
+                return await create_async_websocket_web3_provider(self.config.rpc_ws_url, self.logger)
+            except Exception as e:
+                self.logger.warning("WebSocket RPC connection failed, falling back to HTTP: %s", e)
+
+        return await create_async_web3_provider(self.config.rpc_url, self.logger, pool_size=self.config.rpc_pool_size)
+
+    async def _fetch_price_and_position(self):
+        """Fetch the pool price and hydrate the current position using batched contract reads"""
+        current_pool_price, position_count = await self.foil.get_price_and_position_count(self.account_address)
+        await self.position.hydrate_current_position(position_count)
+        return current_pool_price
+
     async def start(self):
         """Start the arbitrage bot"""
-        self.logger.info(f"Starting bot with {self.config.trade_interval} second interval...")
+        self.logger.info("Starting bot with %s second interval...", self.config.trade_interval)
         self.discord.send_message(
             f"🤖 **Arbitrage Bot is Live!** 🤖\n\n"
             f"• Trade Interval: {self.config.trade_interval}s\n"
@@ -76,11 +97,11 @@ class ArbitrageBot:
         )
 
         # Initialize async web3 provider
-        self.w3 = await create_async_web3_provider(self.config.rpc_url, self.logger)
+        self.w3 = await self._create_web3()
 
         # Load account address - no Web3 instance needed for this
         self.account_address = self.w3.eth.account.from_key(self.config.wallet_pk).address
-        self.logger.info(f"Using wallet address: {self.account_address}")
+        self.logger.info("Using wallet address: %s", self.account_address)
 
         # Initialize API client
         self.api_client = GarbApiClient(self.config.foil_api_url)
@@ -93,52 +114,80 @@ class ArbitrageBot:
         self.position = Position(self.account_address, self.foil, self.w3)
         self.arb_logic = ArbitrageLogic(self.foil, self.position, self.discord)
 
+        # Bind values used every run to locals
+        interval = self.config.trade_interval
+        batch_rpc = self.config.batch_rpc
+        logger = self.logger
+        discord = self.discord
+        api_client = self.api_client
+        foil = self.foil
+        position = self.position
+        arb_logic = self.arb_logic
+
+        # Runs are scheduled on a fixed cadence from this deadline
+        next_run = time.monotonic()
+
         while True:
+            retry_delay = None
             try:
-                start_time = datetime.now()
-                self.logger.info(f"Starting Bot Run - Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                start_mono = time.monotonic()
+                logger.info("Starting Bot Run - Time: %s", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
 
                 # Get all data concurrently - trailing price from API, pool price from contract, and position
                 # Use API client for trailing average price
-                avg_price_task = asyncio.create_task(self.api_client.get_trailing_average("ethereum-gas"))
-                pool_price_task = asyncio.create_task(self.foil.get_current_price_d18())
-                position_task = asyncio.create_task(self.position.hydrate_current_position())
-
-                # Wait for all tasks to complete
-                avg_trailing_price, current_pool_price, _ = await asyncio.gather(
-                    avg_price_task, pool_price_task, position_task
-                )
-
-                self.logger.info(f"Price data - API Avg: {avg_trailing_price} gwei, Pool: {current_pool_price}")
+                if batch_rpc:
+                    # Pool price and position count share a single Multicall3 round trip
+                    avg_trailing_price, current_pool_price = await asyncio.gather(
+                        api_client.get_trailing_average("ethereum-gas"), self._fetch_price_and_position()
+                    )
+                else:
+                    avg_trailing_price, current_pool_price, _ = await asyncio.gather(
+                        api_client.get_trailing_average("ethereum-gas"),
+                        foil.get_current_price_d18(),
+                        position.hydrate_current_position(),
+                    )
+
+                logger.info("Price data - API Avg: %s gwei, Pool: %s", avg_trailing_price, current_pool_price)
 
                 # run arbitrage logic
-                await self.arb_logic.run(Decimal(avg_trailing_price), Decimal(current_pool_price))
-
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                self.logger.info(f"Completed Run in {duration:.2f}s - Next in {self.config.trade_interval}s")
+                await arb_logic.run(Decimal(avg_trailing_price), Decimal(current_pool_price))
 
-                await asyncio.sleep(self.config.trade_interval)
+                duration = time.monotonic() - start_mono
+                logger.info("Completed Run in %.2fs - Next in %.2fs", duration, max(0.0, interval - duration))
+                self._fail_count = 0
 
             except KeyboardInterrupt:
-                self.logger.info("Bot stopped by user")
-                self.discord.send_message(
+                logger.info("Bot stopped by user")
+                discord.send_message(
                     f"⛔ **Bot Stopped by User** ⛔\n\n"
                     f"• Time to take a break! ☕\n"
                     f"• Thanks for the ride! 🎢\n"
                     f"• See you next time! 👋\n\n"
                     f"All positions and profits are safe! 🔒"
                 )
+                # Deliver the stop message before the process exits
+                await asyncio.to_thread(discord.flush)
                 raise
 
             except Exception as e:
-                self.logger.error(f"Error during bot execution: {str(e)}")
-                self.discord.send_message(
+                retry_delay = retry_backoff(e, self._fail_count, interval)
+                self._fail_count += 1
+
+                logger.error("Error during bot execution: %s", e)
+                # Only alert once per distinct error within the dedupe window
+                discord.send_deduplicated(
+                    f"{type(e).__name__}: {e}",
                     f"❌ **Error Alert!** ❌\n\n"
                     f"Something unexpected happened:\n"
                     f"```{str(e)}```\n\n"
                     f"Don't worry, I'll keep trying! 💪\n"
-                    f"Next run in {self.config.trade_interval}s"
+                    f"Next run in {retry_delay:.0f}s",
                 )
-                self.logger.info(f"Next run in {self.config.trade_interval}s")
-                await asyncio.sleep(self.config.trade_interval)
+                logger.info("Next run in %.0fs", retry_delay)
+
+            if retry_delay is not None:
+                # Back off after a failure and restart the schedule from the retry
+                await asyncio.sleep(retry_delay)
+                next_run = time.monotonic()
+            else:
+                next_run = await sleep_until_next_run(next_run, interval, logger)
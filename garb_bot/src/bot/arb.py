@@ -89,7 +89,7 @@ class ArbitrageLogic:
         initial_size = int(initial_size * size_multiplier)
 
         # Get deadline
-        block = await self.position.w3.eth.get_block("latest")
+        block = await self.position.w3.eth.get_block("latest", full_transactions=False)
         current_time = block["timestamp"]
         deadline = current_time + (30 * 60)  # 30 minutes
 
@@ -1,12 +1,10 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from web3 import Web3
-
 from shared.config.config_manager import BaseConfig, ConfigManager
 
 
-@dataclass
+@dataclass(frozen=True)
 class ArbitrageConfig(BaseConfig):
     """
     Configuration for the Arbitrage Bot
@@ -32,6 +30,9 @@ class ArbitrageConfig(BaseConfig):
     discord_channel_id: Optional[str] = None
 
     execute_arbitrage: bool = False
+    batch_rpc: bool = True  # Batch per-run contract reads through Multicall3
+    rpc_pool_size: int = 64  # Maximum pooled keep-alive connections to the RPC
+    rpc_ws_url: Optional[str] = None  # Optional WebSocket RPC URL, preferred over HTTP when set
 
     @classmethod
     def from_env(cls) -> "ArbitrageConfig":
@@ -58,6 +59,9 @@ class ArbitrageConfig(BaseConfig):
         discord_channel_id = ConfigManager.get_optional_str("GARB_BOT_DISCORD_CHANNEL_ID")
 
         execute_arbitrage = ConfigManager.get_bool("GARB_BOT_EXECUTE_ARBITRAGE", False)
+        batch_rpc = ConfigManager.get_bool("GARB_BOT_BATCH_RPC", True)
+        rpc_pool_size = ConfigManager.get_int("GARB_BOT_RPC_POOL_SIZE", 64)
+        rpc_ws_url = ConfigManager.get_optional_str("GARB_BOT_NETWORK_WS_URL") or None
 
         # Create and return config
         return cls(
@@ -73,4 +77,7 @@ class ArbitrageConfig(BaseConfig):
             discord_bot_token=discord_bot_token,
             discord_channel_id=discord_channel_id,
             execute_arbitrage=execute_arbitrage,
+            batch_rpc=batch_rpc,
+            rpc_pool_size=rpc_pool_size,
+            rpc_ws_url=rpc_ws_url,
         )
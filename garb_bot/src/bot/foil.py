@@ -3,13 +3,20 @@ Foil contract interaction module (async version)
 """
 
 import logging
-from typing import TypedDict
+from decimal import Decimal
+from typing import Dict, Tuple, TypedDict
 
 from web3 import Web3
 from web3.contract import Contract
 
 from shared.abis import POSITION_MANAGER_ABI, abi_loader
 from shared.clients.discord_client import DiscordNotifier
+from shared.utils.async_web3_utils import (
+    decode_contract_result,
+    encode_contract_call,
+    get_output_types,
+    multicall_async,
+)
 
 from .config import ArbitrageConfig
 
@@ -42,6 +49,11 @@ class Foil:
         self.epoch = None
         self.market_params = None
 
+        # Calldata and output types for reads repeated every run, encoded once
+        self._reference_price_call = None
+        self._balance_of_calls: Dict[str, Tuple[str, bytes]] = {}
+        self._uint256_types = get_output_types(self.contract, "getReferencePrice")
+
         # Initialize Discord notifier
         self.discord = DiscordNotifier.get_instance("ArbitrageBot", ArbitrageConfig.get_config())
 
@@ -54,22 +66,27 @@ class Foil:
 
     async def is_live(self) -> bool:
         """Check if the epoch is still live"""
-        current_time = (await self.w3.eth.get_block("latest"))["timestamp"]
+        current_time = (await self.w3.eth.get_block("latest", full_transactions=False))["timestamp"]
         return current_time < self.epoch["end_time"]
 
     async def _hydrate_market_and_epoch(self):
         """Get the current epoch asynchronously"""
-        # Get epoch data
-        epoch_data = await self.contract.functions.getEpoch(self.epoch_id).call()
+        # Get epoch data, market data and tick spacing in a single Multicall3 round trip
+        calls = [
+            encode_contract_call(self.contract, "getEpoch", self.epoch_id),
+            encode_contract_call(self.contract, "getMarket"),
+            encode_contract_call(self.contract, "getMarketTickSpacing"),
+        ]
+        (_, epoch_result), (_, market_result), (_, tick_spacing_result) = await multicall_async(self.w3, calls)
+
+        epoch_data = decode_contract_result(self.w3, self.contract, "getEpoch", epoch_result)
         (epoch_id, _, end_time, _, _, _, _, _, base_asset_min_tick, base_asset_max_tick, *_) = epoch_data[0]
         uniswap_position_manager = epoch_data[1][4]
 
-        # Get market data
-        market_data = await self.contract.functions.getMarket().call()
+        market_data = decode_contract_result(self.w3, self.contract, "getMarket", market_result)
         collateral_token = market_data[1]
 
-        # Get tick spacing
-        tick_spacing = await self.contract.functions.getMarketTickSpacing().call()
+        tick_spacing = decode_contract_result(self.w3, self.contract, "getMarketTickSpacing", tick_spacing_result)
 
         position_manager = self.w3.eth.contract(address=uniswap_position_manager, abi=POSITION_MANAGER_ABI)
         collateral_asset = self.w3.eth.contract(address=collateral_token, abi=abi_loader.get_abi("erc20"))
@@ -85,11 +102,14 @@ class Foil:
             "collateral_asset": collateral_asset,
             "tick_spacing": tick_spacing,
         }
+        self._reference_price_call = encode_contract_call(self.contract, "getReferencePrice", epoch_id)
         self.logger.info(f"Initialized epoch {epoch_id} with end time {end_time}")
 
     async def get_current_price_d18(self) -> int:
         """Get the current price asynchronously"""
-        price = await self.contract.functions.getReferencePrice(self.epoch["epoch_id"]).call()
+        target, calldata = self._reference_price_call
+        result = await self.w3.eth.call({"to": target, "data": calldata})
+        (price,) = self.w3.codec.decode(self._uint256_types, result)
         # Convert from wei (18 decimals) to a decimal value using Web3 helper
         return self.w3.from_wei(price, "ether")
 
@@ -97,3 +117,26 @@ class Foil:
         """Get the current price in sqrtPriceX96 asynchronously"""
         pool_price = await self.contract.functions.getSqrtPriceX96(self.epoch["epoch_id"]).call()
         return pool_price
+
+    async def get_price_and_position_count(self, account_address: str) -> Tuple[Decimal, int]:
+        """
+        Get the current price and the account's position count in a single RPC round trip
+
+        Args:
+            account_address: Address whose positions are counted
+
+        Returns:
+            Tuple of (current price, position count)
+        """
+        balance_of_call = self._balance_of_calls.get(account_address)
+        if balance_of_call is None:
+            balance_of_call = encode_contract_call(self.contract, "balanceOf", account_address)
+            self._balance_of_calls[account_address] = balance_of_call
+
+        calls = [self._reference_price_call, balance_of_call]
+        (_, price_data), (_, count_data) = await multicall_async(self.w3, calls)
+
+        # Both reads return a single uint256
+        (price,) = self.w3.codec.decode(self._uint256_types, price_data)
+        (position_count,) = self.w3.codec.decode(self._uint256_types, count_data)
+        return self.w3.from_wei(price, "ether"), position_count
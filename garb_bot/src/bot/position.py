@@ -6,14 +6,24 @@ import logging
 from decimal import Decimal
 from typing import Any, Dict, Optional, TypedDict
 
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
 
+from shared.abis import POSITION_COLLATERAL_WORD, POSITION_KIND_WORD
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.async_web3_utils import send_async_transaction, simulate_async_transaction
+from shared.utils.async_web3_utils import (
+    call_contract_raw,
+    decode_static_word,
+    send_async_transaction,
+    simulate_async_transaction,
+)
 
 from .config import ArbitrageConfig
 from .foil import Foil
 
+# Foil events that can change the account's position
+POSITION_EVENTS = ("Transfer", "TraderPositionCreated", "TraderPositionModified", "PositionSettled")
+
 
 class CurrentPosition(TypedDict):
     kind: int
@@ -36,15 +46,86 @@ class Position:
         self.current = None
         self.position_id = None
 
+        # Log filter for position events, so polls only hydrate again after the position may have changed
+        contract = foil.contract
+        self._event_topics = [
+            Web3.to_hex(event_abi_to_log_topic(abi))
+            for abi in contract.abi
+            if abi.get("type") == "event" and abi["name"] in POSITION_EVENTS
+        ]
+        self._settled_topic = Web3.to_hex(
+            event_abi_to_log_topic(next(abi for abi in contract.abi if abi.get("name") == "PositionSettled"))
+        )
+        self._account_topic = Web3.to_hex(bytes(12) + Web3.to_bytes(hexstr=account_address))
+        self._position_filter = None
+        self._filters_supported = True
+        # Set after this bot's own transactions, which must be seen without waiting on the filter
+        self._stale = True
+
     async def initialize(self):
         """Asynchronously initialize the position"""
         await self.hydrate_current_position()
         return self
 
-    async def hydrate_current_position(self):
-        """Get the current position details asynchronously"""
-        # Get position count
-        position_count = await self.foil.contract.functions.balanceOf(self.account_address).call()
+    def _is_account_log(self, log) -> bool:
+        """Check whether a position event log may concern this account"""
+        topics = [Web3.to_hex(topic) for topic in log["topics"]]
+        # PositionSettled doesn't index its owner, so treat every settlement as relevant
+        if topics[0] == self._settled_topic:
+            return True
+        # Transfer indexes from and to, the trader events index the sender
+        return self._account_topic in topics[1:3]
+
+    async def _position_changed(self) -> bool:
+        """
+        Check whether a position event for this account was emitted since the last check
+
+        Falls back to always reporting a change when the node doesn't support log filters.
+
+        Returns:
+            True if the position has to be hydrated again
+        """
+        if not self._filters_supported:
+            return True
+
+        if self._position_filter is not None:
+            try:
+                logs = await self.w3.eth.get_filter_changes(self._position_filter.filter_id)
+                return any(self._is_account_log(log) for log in logs)
+            except Exception as e:
+                # Nodes drop idle filters, so install a new one and hydrate from scratch
+                self.logger.warning(f"Position event filter lost, reinstalling: {str(e)}")
+
+        # Install the filter before hydrating, so no event between the two is missed
+        try:
+            self._position_filter = await self.w3.eth.filter(
+                {"address": self.foil.contract.address, "topics": [self._event_topics]}
+            )
+        except Exception as e:
+            self.logger.warning(f"Log filters unavailable, hydrating position every run: {str(e)}")
+            self._position_filter = None
+            self._filters_supported = False
+        return True
+
+    async def hydrate_current_position(self, position_count: Optional[int] = None):
+        """
+        Get the current position details asynchronously
+
+        Hydration is skipped while no position event for this account has been emitted since the last one.
+
+        Args:
+            position_count: Position count already fetched for this run, if any
+        """
+        # Always drain the filter so this bot's own events don't trigger a second hydration later.
+        # A change keeps the position stale until a hydration succeeds
+        if await self._position_changed():
+            self._stale = True
+        if not self._stale and self.current is not None:
+            return
+
+        # Get position count unless it was fetched alongside other reads
+        if position_count is None:
+            position_count = await self.foil.contract.functions.balanceOf(self.account_address).call()
 
         if position_count == 0:
             self.logger.info("No positions found")
@@ -52,6 +133,7 @@ class Position:
                 "kind": 0,
                 "collateral_amount": 0,
             }
+            self._stale = False
             return
 
         # Get latest position
@@ -59,9 +141,10 @@ class Position:
             self.account_address, position_count - 1
         ).call()
 
-        # Get position details
-        position_data = await self.foil.contract.functions.getPosition(self.position_id).call()
-        (_, kind, _, collateral_amount, _, _, _, _, _, _) = position_data
+        # Get position details, decoding only the fields used from the static struct
+        position_data = await call_contract_raw(self.w3, self.foil.contract, "getPosition", self.position_id)
+        kind = decode_static_word(position_data, POSITION_KIND_WORD)
+        collateral_amount = decode_static_word(position_data, POSITION_COLLATERAL_WORD)
 
         kind_display = {0: "None", 1: "LP", 2: "Trader"}[kind]
 
@@ -73,6 +156,7 @@ class Position:
             "kind": kind,
             "collateral_amount": collateral_amount,
         }
+        self._stale = False
 
     def has_current_position(self) -> bool:
         """Check if there is a current position"""
@@ -95,6 +179,7 @@ class Position:
             if self.current["kind"] == 2:
                 self.logger.info("Closing Trader Position")
                 await self.close_trader_position()
+                self._stale = True
                 await self.hydrate_current_position()
 
             # Final verification
@@ -108,7 +193,7 @@ class Position:
     async def close_trader_position(self):
         """Close out trader position by setting size to 0"""
         # Get current block timestamp
-        block = await self.w3.eth.get_block("latest")
+        block = await self.w3.eth.get_block("latest", full_transactions=False)
         current_time = block["timestamp"]
         deadline = current_time + (30 * 60)
 
@@ -191,6 +276,7 @@ class Position:
             deadline,
         )
 
+        self._stale = True
         await self.hydrate_current_position()
 
     async def find_maximum_viable_size(
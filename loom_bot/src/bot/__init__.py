@@ -1,9 +1,11 @@
 import asyncio
 import logging
+import time
 from datetime import datetime
 
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.web3_utils import create_web3_provider
+from shared.utils.async_web3_utils import create_async_web3_provider
+from shared.utils.schedule import retry_backoff, sleep_until_next_run
 
 from .api_client import FoilAPIClient
 from .config import BotConfig
@@ -13,6 +15,24 @@ from .position import Position
 from .strategy import BotStrategy
 
 
+def _configure_logger() -> logging.Logger:
+    """Configure the bot logger once per process"""
+    logger = logging.getLogger("LoomBot")
+    logger.setLevel(logging.INFO)
+
+    # Only add a handler once so repeated bot construction doesn't duplicate log lines
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+    return logger
+
+
+_configure_logger()
+
+
 class LoomBot:
     def __init__(self):
         # Load configuration - use reload_config to ensure fresh values
@@ -22,24 +42,19 @@ class LoomBot:
         self.logger = self._setup_logger()
         self.logger.info("Initializing Loom Bot...")
 
-        # Initialize Web3 connection
-        self.w3 = create_web3_provider(self.config.rpc_url, self.logger)
-
         # Initialize API client
         self.api_client = FoilAPIClient(self.config.foil_api_url)
 
-        # Load foil
-        self.foil = Foil(self.w3)
-
         # Initialize Discord notifier
         self.discord = DiscordNotifier.get_instance("LoomBot", self.config)
 
-        # Load account address
-        self.account_address = self.w3.eth.account.from_key(self.config.wallet_pk).address
-        self.logger.info(f"Using wallet address: {self.account_address}")
+        # Web3 connection, foil and position are loaded asynchronously in start()
+        self.w3 = None
+        self.foil = None
+        self.position = None
 
-        # Load position
-        self.position = Position(self.account_address, self.foil, self.w3)
+        # Consecutive failed runs, used for retry backoff
+        self._fail_count = 0
 
         self.logger.info("Bot initialization complete")
 
@@ -47,55 +62,81 @@ class LoomBot:
         self.discord.send_message("🤖 Loom Bot initialized and ready!")
 
     def _setup_logger(self) -> logging.Logger:
-        """Initialize logging configuration"""
-        logger = logging.getLogger("LoomBot")
-        logger.setLevel(logging.INFO)
-
-        # Create console handler with formatting
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
-
-        return logger
+        """Get the bot logger, configured at import time"""
+        return logging.getLogger("LoomBot")
 
     async def start(self):
         """Start the bot"""
         self.logger.info(f"Starting bot with {self.config.bot_run_interval} second interval...")
         self.discord.send_message(f"🚀 Bot started with {self.config.bot_run_interval} second interval")
 
+        # Initialize async web3 provider
+        self.w3 = await create_async_web3_provider(self.config.rpc_url, self.logger)
+
+        # Load foil
+        self.foil = await Foil(self.w3).initialize()
+
+        # Load account address
+        self.account_address = self.w3.eth.account.from_key(self.config.wallet_pk).address
+        self.logger.info(f"Using wallet address: {self.account_address}")
+
+        # Load position
+        self.position = await Position(self.account_address, self.foil, self.w3).initialize()
+
         strategy = BotStrategy(self.position, self.foil, self.account_address)
 
+        # Bind values used every run to locals
+        interval = self.config.bot_run_interval
+        logger = self.logger
+        discord = self.discord
+        api_client = self.api_client
+        foil = self.foil
+        w3 = self.w3
+
+        # Runs are scheduled on a fixed cadence from this deadline
+        next_run = time.monotonic()
+
         while True:
+            retry_delay = None
             try:
-                start_time = datetime.now()
-                self.logger.info(f"Starting Bot Run - Time: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
+                start_mono = time.monotonic()
+                logger.info(f"Starting Bot Run - Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-                # get prices
-                trailing_avg_price = self.api_client.get_trailing_average(
-                    resource_slug="ethereum-gas",
+                # get prices concurrently; the API client is synchronous so it runs in a worker thread
+                trailing_avg_price, current_market_price = await asyncio.gather(
+                    asyncio.to_thread(api_client.get_trailing_average, resource_slug="ethereum-gas"),
+                    foil.get_current_price_d18(),
                 )
-                current_market_price = self.foil.get_current_price_d18()
-                current_market_price = self.w3.from_wei(current_market_price, "ether")
-                self.logger.info(f"Price Details - Trailing Avg: {trailing_avg_price}, Current: {current_market_price}")
-
-                strategy.run(current_market_price, trailing_avg_price)
+                current_market_price = w3.from_wei(current_market_price, "ether")
+                logger.info(f"Price Details - Trailing Avg: {trailing_avg_price}, Current: {current_market_price}")
 
-                end_time = datetime.now()
-                duration = (end_time - start_time).total_seconds()
-                self.logger.info(f"Completed Run in {duration:.2f}s - Next in {self.config.bot_run_interval}s")
+                await strategy.run(current_market_price, trailing_avg_price)
 
-                await asyncio.sleep(self.config.bot_run_interval)
+                duration = time.monotonic() - start_mono
+                logger.info(f"Completed Run in {duration:.2f}s - Next in {max(0.0, interval - duration):.2f}s")
+                self._fail_count = 0
             except KeyboardInterrupt:
-                self.logger.info("Bot stopped by user")
-                self.discord.send_message("⛔ Bot stopped by user")
+                logger.info("Bot stopped by user")
+                discord.send_message("⛔ Bot stopped by user")
+                # Deliver the stop message before the process exits
+                await asyncio.to_thread(discord.flush)
                 raise
             except SkipBotRun:
-                self.logger.info("Skipping bot run due to already optimized position")
-                self.logger.info(f"Next run in {self.config.bot_run_interval}s")
-                await asyncio.sleep(self.config.bot_run_interval)
+                logger.info("Skipping bot run due to already optimized position")
+                logger.info(f"Next run in {interval}s")
+                self._fail_count = 0
             except Exception as e:
-                self.logger.error(f"Error during bot execution: {str(e)}")
-                self.discord.send_message(f"❌ **Error**: {str(e)}")
-                self.logger.info(f"Next run in {self.config.bot_run_interval}s")
-                await asyncio.sleep(self.config.bot_run_interval)
+                retry_delay = retry_backoff(e, self._fail_count, interval)
+                self._fail_count += 1
+
+                logger.error(f"Error during bot execution: {str(e)}")
+                # Only alert once per distinct error within the dedupe window
+                discord.send_deduplicated(f"{type(e).__name__}: {e}", f"❌ **Error**: {str(e)}")
+                logger.info(f"Next run in {retry_delay:.0f}s")
+
+            if retry_delay is not None:
+                # Back off after a failure and restart the schedule from the retry
+                await asyncio.sleep(retry_delay)
+                next_run = time.monotonic()
+            else:
+                next_run = await sleep_until_next_run(next_run, interval, logger)
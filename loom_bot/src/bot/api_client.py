@@ -1,3 +1,4 @@
+import logging
 import time
 from decimal import Decimal
 from typing import Optional, TypedDict
@@ -5,6 +6,30 @@ from typing import Optional, TypedDict
 from gql import Client, gql
 from gql.transport.requests import RequestsHTTPTransport
 
+# Parsed once at import rather than on every fetch
+TRAILING_AVERAGE_QUERY = gql(
+    """
+    query TrailingResourceCandles(
+        $slug: String!
+        $from: Int!
+        $to: Int!
+        $interval: Int!
+        $trailingAvgTime: Int!
+    ) {
+        resourceTrailingAverageCandles(
+          slug: $slug
+          from: $from
+          to: $to
+          interval: $interval
+          trailingAvgTime: $trailingAvgTime
+        ) {
+          timestamp
+          close
+        }
+    }
+    """
+)
+
 
 class TrailingCandle(TypedDict):
     timestamp: int
@@ -15,32 +40,10 @@ class FoilAPIClient:
     def __init__(self, api_url: str):
         transport = RequestsHTTPTransport(url=f"{api_url.rstrip('/')}/graphql")
         self.client = Client(transport=transport, fetch_schema_from_transport=True)
+        self.logger = logging.getLogger("LoomBot.API")
 
     def get_trailing_average(self, resource_slug: str) -> Optional[float]:
         """Fetch the 28-day trailing average price"""
-        query = gql(
-            """
-            query TrailingResourceCandles(
-                $slug: String!
-                $from: Int!
-                $to: Int!
-                $interval: Int!
-                $trailingAvgTime: Int!
-            ) {
-                resourceTrailingAverageCandles(
-                  slug: $slug
-                  from: $from
-                  to: $to
-                  interval: $interval
-                  trailingAvgTime: $trailingAvgTime
-                ) {
-                  timestamp
-                  close
-                }
-            }
-        """
-        )
-
         now = int(time.time())
         trailing_time = 5 * 60  # 5 minutes in seconds
         trailing_avg_time = 28 * 24 * 60 * 60  # 28 days in seconds
@@ -53,17 +56,17 @@ class FoilAPIClient:
             "trailingAvgTime": trailing_avg_time,
         }
 
-        import logging
-
-        logger = logging.getLogger("LoomBot.API")
-        logger.info(f"Fetching trailing average for {resource_slug}")
-        logger.info(
-            f"Query variables: from={variables['from']}, to={variables['to']}, "
-            f"interval={variables['interval']}, trailingAvgTime={variables['trailingAvgTime']}"
+        self.logger.info("Fetching trailing average for %s", resource_slug)
+        self.logger.info(
+            "Query variables: from=%s, to=%s, interval=%s, trailingAvgTime=%s",
+            variables["from"],
+            variables["to"],
+            variables["interval"],
+            variables["trailingAvgTime"],
         )
 
         try:
-            result = self.client.execute(query, variable_values=variables)
+            result = self.client.execute(TRAILING_AVERAGE_QUERY, variable_values=variables)
             candles = result["resourceTrailingAverageCandles"]
 
             if not candles:
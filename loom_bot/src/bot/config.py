@@ -4,7 +4,7 @@ from typing import Optional
 from shared.config.config_manager import BaseConfig, ConfigManager
 
 
-@dataclass
+@dataclass(frozen=True)
 class BotConfig(BaseConfig):
     """Bot configuration loaded from environment variables"""
 
@@ -18,6 +18,7 @@ class BotConfig(BaseConfig):
     max_position_size: float
     trailing_average_days: int
     bot_run_interval: int
+    pipeline_approve: bool = False
     discord_bot_token: Optional[str] = None
     discord_channel_id: Optional[str] = None
 
@@ -41,6 +42,9 @@ class BotConfig(BaseConfig):
         trailing_average_days = ConfigManager.get_int("TRAILING_AVERAGE_DAYS", 28)
         bot_run_interval = ConfigManager.get_int("BOT_RUN_INTERVAL", 600)
 
+        # Send the approve and position creation back to back instead of waiting for the approve to be mined
+        pipeline_approve = ConfigManager.get_bool("PIPELINE_APPROVE", False)
+
         # Discord configuration
         discord_bot_token = ConfigManager.get_optional_str("DISCORD_BOT_TOKEN")
         discord_channel_id = ConfigManager.get_optional_str("DISCORD_CHANNEL_ID")
@@ -57,6 +61,7 @@ class BotConfig(BaseConfig):
             max_position_size=max_position_size,
             trailing_average_days=trailing_average_days,
             bot_run_interval=bot_run_interval,
+            pipeline_approve=pipeline_approve,
             discord_bot_token=discord_bot_token,
             discord_channel_id=discord_channel_id,
         )
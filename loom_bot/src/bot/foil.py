@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import TypedDict
 
@@ -33,28 +34,41 @@ class Foil:
         self.contract = w3.eth.contract(address=foil_address, abi=abi_loader.get_abi("foil"))
         self.logger.info(f"Loaded foil contract at {foil_address}")
 
-        self._hydrate_market_and_epoch()
+        # These will be initialized in the async initialization
+        self.epoch = None
+        self.market_params = None
+
+    async def initialize(self):
+        """Load the epoch and market data and announce the connection"""
+        await self._hydrate_market_and_epoch()
 
         # Send message to Discord with foil address and epoch id
         discord = DiscordNotifier.get_instance("LoomBot", self.config)
         discord.send_message(
-            f"🧠 **Foil Market Connected**\n- Contract: {foil_address}\n- Epoch ID: {self.epoch['epoch_id']}"
+            f"🧠 **Foil Market Connected**\n- Contract: {self.contract.address}\n- Epoch ID: {self.epoch['epoch_id']}"
         )
+        return self
 
-    def is_live(self) -> str:
-        """Get the token name"""
-        current_time = self.w3.eth.get_block("latest").timestamp
+    async def is_live(self) -> bool:
+        """Check if the epoch is still live"""
+        current_time = (await self.w3.eth.get_block("latest", full_transactions=False))["timestamp"]
         return current_time < self.epoch["end_time"]
 
-    def _hydrate_market_and_epoch(self):
+    async def _hydrate_market_and_epoch(self):
         """Get the current epoch"""
+        # The epoch, market and tick spacing reads are independent, so run them concurrently
         (
-            (epoch_id, _, end_time, _, _, _, _, _, base_asset_min_tick, base_asset_max_tick, *_),
-            (_, _, _, _, uniswap_position_manager, *_),
-        ) = self.contract.functions.getLatestEpoch().call()
-
-        (_, collateral_token, *_) = self.contract.functions.getMarket().call()
-        tick_spacing = self.contract.functions.getMarketTickSpacing().call()
+            (
+                (epoch_id, _, end_time, _, _, _, _, _, base_asset_min_tick, base_asset_max_tick, *_),
+                (_, _, _, _, uniswap_position_manager, *_),
+            ),
+            (_, collateral_token, *_),
+            tick_spacing,
+        ) = await asyncio.gather(
+            self.contract.functions.getLatestEpoch().call(),
+            self.contract.functions.getMarket().call(),
+            self.contract.functions.getMarketTickSpacing().call(),
+        )
 
         position_manager = self.w3.eth.contract(address=uniswap_position_manager, abi=POSITION_MANAGER_ABI)
         collateral_asset = self.w3.eth.contract(address=collateral_token, abi=abi_loader.get_abi("erc20"))
@@ -71,12 +85,12 @@ class Foil:
             "tick_spacing": tick_spacing,
         }
 
-    def get_current_price_d18(self) -> int:
+    async def get_current_price_d18(self) -> int:
         """Get the current price"""
-        price = self.contract.functions.getReferencePrice(self.epoch["epoch_id"]).call()
+        price = await self.contract.functions.getReferencePrice(self.epoch["epoch_id"]).call()
         return price
 
-    def get_current_price_sqrt_x96(self) -> int:
+    async def get_current_price_sqrt_x96(self) -> int:
         """Get the current price in sqrtPriceX96. Returns a large integer that may exceed int bounds."""
-        price = self.contract.functions.getSqrtPriceX96(self.epoch["epoch_id"]).call()
+        price = await self.contract.functions.getSqrtPriceX96(self.epoch["epoch_id"]).call()
         return price
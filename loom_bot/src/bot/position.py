@@ -1,16 +1,49 @@
+import asyncio
 import logging
-from typing import TypedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from web3 import Web3
 
+from shared.abis import (
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESS,
+    POSITION_COLLATERAL_WORD,
+    POSITION_KIND_WORD,
+    POSITION_UNISWAP_ID_WORD,
+    UNISWAP_LIQUIDITY_WORD,
+    UNISWAP_TICK_LOWER_WORD,
+    UNISWAP_TICK_UPPER_WORD,
+)
 from shared.clients.discord_client import DiscordNotifier
-from shared.utils.web3_utils import send_transaction, simulate_transaction, tick_to_sqrt_price_x96
+from shared.utils.async_web3_utils import (
+    TransactionConfig,
+    call_contract_raw,
+    decode_contract_result,
+    decode_static_word,
+    encode_contract_call,
+    multicall_async,
+    send_async_transaction,
+    simulate_async_transaction,
+    submit_async_transaction,
+    submit_encoded_transaction,
+    wait_for_async_transaction,
+)
+from shared.utils.web3_utils import BASE_CHAIN_ID, tick_to_sqrt_price_x96
 
 from .config import BotConfig
 from .foil import Foil
 
+# Headroom over the gas used by the last position creation, for creations sent without an estimate
+CREATE_GAS_LIMIT_MULTIPLIER = 1.5
+
+
+@dataclass
+class CurrentPosition:
+    # Slots give fixed attribute storage without a per-instance dict.
+    # They're declared by hand since @dataclass(slots=True) needs Python 3.10
+    __slots__ = ("kind", "uniswap_position_id", "liquidity", "tick_lower", "tick_upper", "collateral_amount")
 
-class CurrentPosition(TypedDict):
     kind: int
     uniswap_position_id: int
     liquidity: int
@@ -30,37 +63,119 @@ class Position:
         # Initialize Discord notifier
         self.discord = DiscordNotifier.get_instance("LoomBot", BotConfig.get_config())
 
-        self.hydrate_current_position()
-
-    def hydrate_current_position(self):
-        position_count = self.foil.contract.functions.balanceOf(self.account_address).call()
-
-        if position_count == 0:
-            self.logger.info("No positions found")
-            self.current = {
-                "kind": 0,
-                "uniswap_position_id": 0,
-                "liquidity": 0,
-                "tick_lower": 0,
-                "tick_upper": 0,
-                "collateral_amount": 0,
-            }
-            return
-
-        # get latest position
-        self.position_id = self.foil.contract.functions.tokenOfOwnerByIndex(
-            self.account_address, position_count - 1
-        ).call()
+        # Multicall3 also serves the block timestamp, so it can be read in the same batch as contract state
+        self.multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
 
-        (_, kind, _, collateral_amount, _, _, _, _, uniswap_position_id, _) = self.foil.contract.functions.getPosition(
-            self.position_id
-        ).call()
+        # Calldata of reads whose arguments never change, encoded once rather than on every call
+        self._position_count_call = encode_contract_call(foil.contract, "balanceOf", account_address)
+        self._sqrt_price_call = encode_contract_call(foil.contract, "getSqrtPriceX96", foil.epoch["epoch_id"])
+        self._collateral_balance_call = encode_contract_call(
+            foil.market_params["collateral_asset"], "balanceOf", account_address
+        )
+        self._block_timestamp_call = encode_contract_call(self.multicall, "getCurrentBlockTimestamp")
+        self._allowance_call = encode_contract_call(
+            foil.market_params["collateral_asset"], "allowance", account_address, foil.contract.address
+        )
+
+        # Position state will be initialized when hydrated
+        self.current: Optional[CurrentPosition] = None
+        self.position_id = None
+
+        # Transaction settings shared by every send, completed with the chain ID in initialize()
+        self.tx_config: TransactionConfig = {}
+
+        # Gas limit for pipelined position creation, learned from the last one sent on its own
+        self._create_gas_limit: Optional[int] = None
+
+    async def initialize(self):
+        """Asynchronously initialize the position"""
+        # Setting the chain ID up front saves building each transaction from fetching it
+        chain_id, _ = await asyncio.gather(self.w3.eth.chain_id, self.hydrate_current_position())
+        self.tx_config = {"custom_transaction_params": {"chainId": chain_id}}
+        if chain_id == BASE_CHAIN_ID:
+            # Base mainnet often needs higher priority fees
+            self.tx_config["min_priority_fee"] = int(0.001 * 10**9)  # Minimum 0.001 gwei
+            self.tx_config["max_fee_per_gas_multiplier"] = 3  # Larger buffer for Base
+        return self
+
+    async def _read_position_count_and_cached(self):
+        """
+        Get the account's position count and the details of the cached position ID if the account still owns it
+
+        The count, ownership and position details are read in a single Multicall3 round trip. When the cached
+        position was last seen as an LP position, its Uniswap position is read speculatively in the same batch.
+
+        Returns:
+            Tuple of (position count, raw getPosition return data or None if there is no cached position ID
+            or it is no longer owned, raw positions() return data of the last known Uniswap position ID or None)
+        """
+        contract = self.foil.contract
+        calls = [self._position_count_call]
+        if self.position_id:
+            calls.append(encode_contract_call(contract, "ownerOf", self.position_id))
+            calls.append(encode_contract_call(contract, "getPosition", self.position_id))
+            if self.current and self.current.kind == 1:
+                position_manager = self.foil.market_params["uniswap_position_manager"]
+                calls.append(encode_contract_call(position_manager, "positions", self.current.uniswap_position_id))
+
+        # ownerOf reverts for burned positions, so allow failures rather than reverting the batch
+        (count_success, count_data), *cached_results = await multicall_async(self.w3, calls, allow_failure=True)
+        if not count_success:
+            raise ValueError("Failed to read position count")
+        position_count = decode_static_word(count_data, 0)
+
+        if not cached_results:
+            return position_count, None, None
+        (owner_success, owner_data), (position_success, position_data), *uniswap_results = cached_results
+        if not (owner_success and position_success):
+            return position_count, None, None
+        if decode_contract_result(self.w3, contract, "ownerOf", owner_data) != self.account_address:
+            return position_count, None, None
+        uniswap_data = uniswap_results[0][1] if uniswap_results and uniswap_results[0][0] else None
+        return position_count, position_data, uniswap_data
+
+    async def hydrate_current_position(self):
+        """Get the current position details"""
+        # Skip looking up the latest position while the account still owns the cached one
+        last_uniswap_position_id = self.current.uniswap_position_id if self.current else None
+        position_count, position, uniswap_data = await self._read_position_count_and_cached()
+
+        if position is None:
+            if position_count == 0:
+                self.logger.info("No positions found")
+                self.current = CurrentPosition(
+                    kind=0,
+                    uniswap_position_id=0,
+                    liquidity=0,
+                    tick_lower=0,
+                    tick_upper=0,
+                    collateral_amount=0,
+                )
+                return
+
+            # Each remaining read depends on the previous one, so they are awaited in sequence
+            # get latest position
+            self.position_id = await self.foil.contract.functions.tokenOfOwnerByIndex(
+                self.account_address, position_count - 1
+            ).call()
+
+            position = await call_contract_raw(self.w3, self.foil.contract, "getPosition", self.position_id)
+
+        # Both structs are static, so only the fields used are decoded from their words
+        kind = decode_static_word(position, POSITION_KIND_WORD)
+        collateral_amount = decode_static_word(position, POSITION_COLLATERAL_WORD)
+        uniswap_position_id = decode_static_word(position, POSITION_UNISWAP_ID_WORD)
 
         if kind == 1:
-            position_data = (
-                self.foil.market_params["uniswap_position_manager"].functions.positions(uniswap_position_id).call()
-            )
-            (_, _, _, _, _, tick_lower, tick_upper, liquidity, _, _, _, _) = position_data
+            # Reuse the speculative read when it was for the same Uniswap position
+            if uniswap_data is not None and uniswap_position_id == last_uniswap_position_id:
+                position_data = uniswap_data
+            else:
+                position_manager = self.foil.market_params["uniswap_position_manager"]
+                position_data = await call_contract_raw(self.w3, position_manager, "positions", uniswap_position_id)
+            tick_lower = decode_static_word(position_data, UNISWAP_TICK_LOWER_WORD, signed=True)
+            tick_upper = decode_static_word(position_data, UNISWAP_TICK_UPPER_WORD, signed=True)
+            liquidity = decode_static_word(position_data, UNISWAP_LIQUIDITY_WORD)
         else:
             tick_lower = 0
             tick_upper = 0
@@ -80,29 +195,29 @@ class Position:
                 Collateral Amount: {collateral_amount}"""
         )
 
-        self.current = {
-            "kind": kind,
-            "uniswap_position_id": uniswap_position_id,
-            "liquidity": liquidity,
-            "tick_lower": tick_lower,
-            "tick_upper": tick_upper,
-            "collateral_amount": collateral_amount,
-        }
+        self.current = CurrentPosition(
+            kind=kind,
+            uniswap_position_id=uniswap_position_id,
+            liquidity=liquidity,
+            tick_lower=tick_lower,
+            tick_upper=tick_upper,
+            collateral_amount=collateral_amount,
+        )
 
     def has_current_position(self) -> bool:
-        return self.current["kind"] != 0 and self.current["collateral_amount"] != 0
+        return self.current.kind != 0 and self.current.collateral_amount != 0
 
-    def close_lp_position(self) -> int:
+    async def close_lp_position(self) -> int:
         """
         Decrease liquidity to 0 and return the new position kind
         """
-        current_time = self.w3.eth.get_block("latest").timestamp
+        current_time = (await self.w3.eth.get_block("latest", full_transactions=False))["timestamp"]
         deadline = current_time + (30 * 60)  # 30 minutes from now
 
         # Create decrease liquidity params struct as tuple
         decrease_params = (
             self.position_id,  # positionId
-            self.current["liquidity"],  # liquidity
+            self.current.liquidity,  # liquidity
             0,  # minGasAmount
             0,  # minEthAmount
             deadline,  # deadline
@@ -110,7 +225,7 @@ class Position:
 
         # First simulate the transaction to check the result
         self.logger.info("Simulating decrease liquidity transaction...")
-        simulation_result = simulate_transaction(
+        simulation_result = await simulate_async_transaction(
             self.foil.w3,
             self.foil.contract.functions.decreaseLiquidityPosition,
             self.account_address,
@@ -134,7 +249,7 @@ class Position:
             raise ValueError("Closing LP will cause position to transition to trader, aborting...")
 
         # If we get here, it's safe to proceed with the actual transaction
-        send_transaction(
+        await send_async_transaction(
             self.foil.w3,
             self.foil.contract.functions.decreaseLiquidityPosition,
             self.account_address,
@@ -142,6 +257,8 @@ class Position:
             self.logger,
             "LOOM: Decrease Liquidity",
             decrease_params,
+            tx_config=self.tx_config,
+            poll_latency=2,
         )
 
         # Notify Discord that the position was closed
@@ -149,15 +266,15 @@ class Position:
 
         self.logger.info("LP Position successfully closed")
 
-    def close_trader_position(self):
+    async def close_trader_position(self):
         """
         Close out trader position by setting size to 0
         """
-        current_time = self.w3.eth.get_block("latest").timestamp
+        current_time = (await self.w3.eth.get_block("latest", full_transactions=False))["timestamp"]
         deadline = current_time + (30 * 60)
 
         # Send modify trader position transaction
-        send_transaction(
+        await send_async_transaction(
             self.w3,
             self.foil.contract.functions.modifyTraderPosition,
             self.account_address,
@@ -168,17 +285,19 @@ class Position:
             0,  # size
             0,  # deltaCollateralLimit
             deadline,  # deadline
+            tx_config=self.tx_config,
+            poll_latency=2,
         )
 
-    def close_current_position(self):
+    async def close_current_position(self):
         """Close current position fully"""
         try:
-            if self.current["kind"] == 1:
+            if self.current.kind == 1:
                 self.logger.info("Closing LP Position")
-                self.close_lp_position()
-                self.hydrate_current_position()
+                await self.close_lp_position()
+                await self.hydrate_current_position()
 
-                if self.current["kind"] != 0:
+                if self.current.kind != 0:
                     raise ValueError("Could not close position, something went wrong")
 
                 # elif kind == 1:
@@ -191,43 +310,51 @@ class Position:
                 #     raise ValueError("Invalid position kind after decrease")
 
             # Handle trader position first if it exists
-            if self.current["kind"] == 2:
+            if self.current.kind == 2:
                 # self.logger.info("Closing Trader Position")
                 # self.close_trader_position()
                 # self.hydrate_current_position()
                 raise ValueError("Detected Trader Position, aborting...")
 
             # Final verification
-            if self.current["kind"] != 0:
-                raise ValueError(f"Failed to fully close position. Final kind: {self.current['kind']}")
+            if self.current.kind != 0:
+                raise ValueError(f"Failed to fully close position. Final kind: {self.current.kind}")
 
         except Exception as e:
             self.logger.error(f"Error closing position {self.position_id}: {str(e)}")
             raise e
 
-    def open_new_position(self, new_lower: int, new_upper: int):
+    async def open_new_position(self, new_lower: int, new_upper: int):
         """Open a new position with the given lower and upper ticks"""
+        # Read once, the epoch doesn't change while a position is opened
+        epoch_id = self.foil.epoch["epoch_id"]
+
         sqrt_price_x96_lower = tick_to_sqrt_price_x96(new_lower)
         sqrt_price_x96_upper = tick_to_sqrt_price_x96(new_upper)
-        sqrt_price_x96_current = self.foil.get_current_price_sqrt_x96()
 
         # Calculate token amounts
-        # Get user's collateral balance
-        collateral_balance = (
-            self.foil.market_params["collateral_asset"].functions.balanceOf(self.account_address).call()
+        # Get the current price, collateral balance and allowance, and block timestamp in one Multicall3 round trip
+        calls = [self._sqrt_price_call, self._collateral_balance_call, self._block_timestamp_call, self._allowance_call]
+        (_, price_data), (_, balance_data), (_, timestamp_data), (_, allowance_data) = await multicall_async(
+            self.w3, calls
         )
+        # Each read returns a single unsigned integer
+        sqrt_price_x96_current = decode_static_word(price_data, 0)
+        collateral_balance = decode_static_word(balance_data, 0)
+        current_time = decode_static_word(timestamp_data, 0)
+        allowance = decode_static_word(allowance_data, 0)
 
-        # Use minimum of balance and configured max amount
+        # Use minimum of balance and configured max amount, cast once since the configured max is a float
         config = BotConfig.get_config()
-        deposit_amount = min(collateral_balance, config.max_position_size)
+        deposit_amount = int(min(collateral_balance, config.max_position_size))
 
         # Quote required token amounts for liquidity
-        (token0_amount, token1_amount, _) = self.foil.contract.functions.quoteLiquidityPositionTokens(
-            int(self.foil.epoch["epoch_id"]),
-            int(deposit_amount),
-            int(sqrt_price_x96_current),
-            int(sqrt_price_x96_lower),
-            int(sqrt_price_x96_upper),
+        (token0_amount, token1_amount, _) = await self.foil.contract.functions.quoteLiquidityPositionTokens(
+            epoch_id,
+            deposit_amount,
+            sqrt_price_x96_current,
+            sqrt_price_x96_lower,
+            sqrt_price_x96_upper,
         ).call()
 
         self.logger.info(
@@ -240,61 +367,121 @@ class Position:
             Token1 Amount:      {token1_amount}"""
         )
 
-        # Approve collateral spending
-        send_transaction(
-            self.w3,
-            self.foil.market_params["collateral_asset"].functions.approve,
-            self.account_address,
-            self.pk,
-            self.logger,
-            "LOOM: Approve Collateral",
-            self.foil.contract.address,
-            int(deposit_amount),
-        )
-
-        # Get current timestamp and add 30 minutes for deadline
-        current_block = self.w3.eth.get_block("latest")
-        deadline = current_block.timestamp + (30 * 60)
+        # Add 30 minutes to the batched block timestamp for deadline
+        deadline = current_time + (30 * 60)
 
         # Create position parameters struct as tuple
         position_params = (
-            int(self.foil.epoch["epoch_id"]),  # epochId: uint256
-            int(token0_amount),  # amountTokenA: uint256
-            int(token1_amount),  # amountTokenB: uint256
-            int(deposit_amount),  # collateralAmount: uint256
-            int(new_lower),  # lowerTick: int24
-            int(new_upper),  # upperTick: int24
+            epoch_id,  # epochId: uint256
+            token0_amount,  # amountTokenA: uint256
+            token1_amount,  # amountTokenB: uint256
+            deposit_amount,  # collateralAmount: uint256
+            new_lower,  # lowerTick: int24
+            new_upper,  # upperTick: int24
             0,  # minAmountTokenA: uint256
             0,  # minAmountTokenB: uint256
-            int(deadline),  # deadline: uint256
+            deadline,  # deadline: uint256
         )
-
-        try:
-            # Send transaction
-            send_transaction(
+        # Encoded once, for gas estimation and the transaction alike
+        create_call = encode_contract_call(self.foil.contract, "createLiquidityPosition", position_params)
+
+        # An allowance left over from an earlier approve may already cover the deposit
+        needs_approve = allowance < deposit_amount
+        if not needs_approve:
+            self.logger.info(f"Allowance {allowance} covers deposit, skipping approve")
+
+        # Pipelining needs a gas limit for the creation, which can't be estimated before the approve is mined
+        pipelined = needs_approve and config.pipeline_approve and self._create_gas_limit is not None
+        if needs_approve and not pipelined:
+            # Approve collateral spending
+            await send_async_transaction(
                 self.w3,
-                self.foil.contract.functions.createLiquidityPosition,
+                self.foil.market_params["collateral_asset"].functions.approve,
                 self.account_address,
                 self.pk,
                 self.logger,
-                "LOOM: Create Liquidity Position",
-                position_params,
+                "LOOM: Approve Collateral",
+                self.foil.contract.address,
+                deposit_amount,
+                tx_config=self.tx_config,
+                poll_latency=2,
             )
 
-            # Get new position details
-            self.hydrate_current_position()
-
-            # Format message with position details
-            message = (
-                f"🆕 **New Position Created**\n"
-                f"- Position ID: {self.position_id}\n"
-                f"- Tick Range: {self.current['tick_lower']} to {self.current['tick_upper']}\n"
-                f"- Liquidity: {self.current['liquidity']}\n"
-                f"- Collateral Amount: {self.current['collateral_amount']}"
-            )
-
-            self.discord.send_message(message)
+        try:
+            if pipelined:
+                await self._approve_and_create_pipelined(deposit_amount, create_call)
+            else:
+                # Send transaction
+                create_hash = await submit_encoded_transaction(
+                    self.w3,
+                    create_call,
+                    self.account_address,
+                    self.pk,
+                    self.logger,
+                    "LOOM: Create Liquidity Position",
+                    tx_config=self.tx_config,
+                )
+                receipt = await wait_for_async_transaction(
+                    self.w3, create_hash, self.logger, "LOOM: Create Liquidity Position", poll_latency=2
+                )
+                # Learned here since pipelined creations are sent without a gas estimate
+                self._create_gas_limit = int(receipt["gasUsed"] * CREATE_GAS_LIMIT_MULTIPLIER)
+
+            # The new position is now the latest, so drop the cached ID and look it up
+            self.position_id = None
+            await self.hydrate_current_position()
+
+            # Format message with position details, only when it will be sent
+            if self.discord.enabled:
+                message = (
+                    f"🆕 **New Position Created**\n"
+                    f"- Position ID: {self.position_id}\n"
+                    f"- Tick Range: {self.current.tick_lower} to {self.current.tick_upper}\n"
+                    f"- Liquidity: {self.current.liquidity}\n"
+                    f"- Collateral Amount: {self.current.collateral_amount}"
+                )
+
+                self.discord.send_message(message)
 
         except Exception as e:
             self.logger.error(f"Failed to create liquidity position: {str(e)}")
             raise
+
+    async def _approve_and_create_pipelined(self, deposit_amount: int, create_call: Tuple[str, bytes]):
+        """
+        Send the approve and position creation with consecutive nonces, then wait for both receipts
+
+        Args:
+            deposit_amount: Collateral amount to approve
+            create_call: Encoded createLiquidityPosition call
+        """
+        nonce = await self.w3.eth.get_transaction_count(self.account_address, "pending")
+
+        approve_hash = await submit_async_transaction(
+            self.w3,
+            self.foil.market_params["collateral_asset"].functions.approve,
+            self.account_address,
+            self.pk,
+            self.logger,
+            "LOOM: Approve Collateral",
+            self.foil.contract.address,
+            deposit_amount,
+            tx_config={**self.tx_config, "nonce": nonce},
+        )
+        # Not estimated, since the creation would revert until the approve is mined
+        create_hash = await submit_encoded_transaction(
+            self.w3,
+            create_call,
+            self.account_address,
+            self.pk,
+            self.logger,
+            "LOOM: Create Liquidity Position",
+            tx_config={**self.tx_config, "nonce": nonce + 1, "gas_limit": self._create_gas_limit},
+        )
+
+        await asyncio.gather(
+            wait_for_async_transaction(self.w3, approve_hash, self.logger, "LOOM: Approve Collateral", poll_latency=2),
+            wait_for_async_transaction(
+                self.w3, create_hash, self.logger, "LOOM: Create Liquidity Position", poll_latency=2
+            ),
+        )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from shared.clients.discord_client import DiscordNotifier
@@ -16,16 +17,23 @@ class BotStrategy:
         self.config = BotConfig.get_config()
         self.discord = DiscordNotifier.get_instance("LoomBot", BotConfig.get_config())
 
-    def check_conditions(self, current_price: float, trailing_avg: float) -> tuple[int, int]:
+    async def check_conditions(self, current_price: float, trailing_avg: float) -> tuple[int, int]:
         """Determine if position needs rebalancing based on price data"""
+        # Without an active position the balance is needed too, so read it alongside the live check
+        has_current_position = self.position.has_current_position()
+        if has_current_position:
+            is_live = await self.foil.is_live()
+        else:
+            is_live, balance_check = await asyncio.gather(self.foil.is_live(), self.has_minimum_balance())
+
         # if epoch is not live, raise error
-        if not self.foil.is_live():
+        if not is_live:
             raise ValueError("Epoch is not live")
 
         (_, current_tick, trailing_avg_tick, is_current_price_higher) = self.get_max_tick(current_price, trailing_avg)
         tick_spacing = self.foil.market_params["tick_spacing"]
-        current_position_tick_lower = self.position.current["tick_lower"]
-        current_position_tick_upper = self.position.current["tick_upper"]
+        current_position_tick_lower = self.position.current.tick_lower
+        current_position_tick_upper = self.position.current.tick_upper
 
         self.logger.info(
             f"""
@@ -41,8 +49,8 @@ class BotStrategy:
         )
 
         # if no active position
-        if not self.position.has_current_position():
-            (has_minimum_balance, account_collateral_balance, min_position_size) = self.has_minimum_balance()
+        if not has_current_position:
+            (has_minimum_balance, account_collateral_balance, min_position_size) = balance_check
             if not has_minimum_balance:
                 self.logger.info(
                     f"Balance Details - Account Balance: {account_collateral_balance}, "
@@ -77,10 +85,10 @@ class BotStrategy:
         trailing_avg_tick = price_to_tick(trailing_avg, self.foil.market_params["tick_spacing"])
         return max(current_tick, trailing_avg_tick), current_tick, trailing_avg_tick, current_tick > trailing_avg_tick
 
-    def has_minimum_balance(self) -> tuple[bool, int, int]:
+    async def has_minimum_balance(self) -> tuple[bool, int, int]:
         """Check if the account has a minimum balance"""
         account_collateral_balance = (
-            self.foil.market_params["collateral_asset"].functions.balanceOf(self.account_address).call()
+            await self.foil.market_params["collateral_asset"].functions.balanceOf(self.account_address).call()
         )
         return (
             account_collateral_balance >= self.config.min_position_size,
@@ -101,14 +109,14 @@ class BotStrategy:
             high_tick = min(max_market_tick, low_tick + (tick_spacing * self.config.lp_range_width))
             return (low_tick, high_tick)
 
-    def run(self, current_market_price: float, trailing_avg_price: float):
+    async def run(self, current_market_price: float, trailing_avg_price: float):
         """Execute the rebalancing transaction"""
 
-        (current_tick, trailing_avg_tick) = self.check_conditions(current_market_price, trailing_avg_price)
+        (current_tick, trailing_avg_tick) = await self.check_conditions(current_market_price, trailing_avg_price)
 
         # Your rebalancing execution here
         if self.position.has_current_position():
-            self.position.close_current_position()
+            await self.position.close_current_position()
 
         (new_lower, new_upper) = self.calculate_new_range(current_tick, trailing_avg_tick)
         self.logger.info(
@@ -120,4 +128,4 @@ class BotStrategy:
                 New Upper Tick:     {new_upper}"""
         )
 
-        self.position.open_new_position(new_lower, new_upper)
+        await self.position.open_new_position(new_lower, new_upper)
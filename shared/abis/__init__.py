@@ -27,6 +27,55 @@ POSITION_MANAGER_ABI = [
     }
 ]
 
+# 32-byte word indexes of fields in Foil getPosition's static Position.Data struct, for decode_static_word
+POSITION_KIND_WORD = 1
+POSITION_COLLATERAL_WORD = 3
+POSITION_UNISWAP_ID_WORD = 8
+
+# 32-byte word indexes of fields in the position manager's positions() outputs, for decode_static_word
+UNISWAP_TICK_LOWER_WORD = 5
+UNISWAP_TICK_UPPER_WORD = 6
+UNISWAP_LIQUIDITY_WORD = 7
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+    {
+        "inputs": [],
+        "name": "getCurrentBlockTimestamp",
+        "outputs": [{"name": "timestamp", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
 
 class ContractJSON(TypedDict):
     address: str
@@ -2,9 +2,11 @@
 Async GraphQL API client for Foil
 """
 
+import asyncio
 import logging
 import time
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Dict, Optional, TypedDict
 
 from gql import Client, gql
@@ -13,6 +15,12 @@ from gql.transport.exceptions import TransportQueryError
 from web3 import Web3
 
 
+@lru_cache(maxsize=1024)
+def _checksum(address: str) -> str:
+    """Checksum an address, caching results since the API returns the same addresses every run"""
+    return Web3.to_checksum_address(address)
+
+
 class TrailingCandle(TypedDict):
     timestamp: int
     close: str
@@ -27,6 +35,27 @@ class AsyncFoilAPIClient:
         self.client = Client(transport=transport, fetch_schema_from_transport=True)
         self.logger = logging.getLogger("FoilBot.API")
 
+        # Long-lived session opened on first query, so its keepalive connections are reused across queries
+        self._session = None
+        self._session_lock: Optional[asyncio.Lock] = None
+
+    async def _get_session(self):
+        """Get the shared GraphQL session, connecting on first use"""
+        if self._session is None:
+            # Created lazily so it binds to the running event loop
+            if self._session_lock is None:
+                self._session_lock = asyncio.Lock()
+            async with self._session_lock:
+                if self._session is None:
+                    self._session = await self.client.connect_async()
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared GraphQL session and its connections"""
+        if self._session is not None:
+            self._session = None
+            await self.client.close_async()
+
     async def get_trailing_average(self, resource_slug: str) -> Optional[float]:
         """
         Asynchronously fetch the trailing average price
@@ -80,7 +109,7 @@ class AsyncFoilAPIClient:
 
         try:
             # Execute the query asynchronously
-            result = await self.client.execute_async(query, variable_values=variables)
+            result = await (await self._get_session()).execute(query, variable_values=variables)
             candles = result["resourceTrailingAverageCandles"]
 
             if not candles:
@@ -159,7 +188,7 @@ class AsyncFoilAPIClient:
 
         try:
             # Execute the query asynchronously
-            result = await self.client.execute_async(query, variable_values=variables)
+            result = await (await self._get_session()).execute(query, variable_values=variables)
 
             # Checksum all addresses in the result
             self._checksum_addresses_in_result(result)
@@ -188,11 +217,11 @@ class AsyncFoilAPIClient:
             for market_group in result["marketGroups"]:
                 # Checksum market group address
                 if market_group.get("address"):
-                    market_group["address"] = Web3.to_checksum_address(market_group["address"])
+                    market_group["address"] = _checksum(market_group["address"])
 
                 # Checksum collateral asset address
                 if "collateralAsset" in market_group and market_group["collateralAsset"]:
-                    market_group["collateralAsset"] = Web3.to_checksum_address(market_group["collateralAsset"])
+                    market_group["collateralAsset"] = _checksum(market_group["collateralAsset"])
 
                 # Checksum uniswap position manager address
                 if "marketParams" in market_group and market_group["marketParams"]:
@@ -200,7 +229,7 @@ class AsyncFoilAPIClient:
                         "uniswapPositionManager" in market_group["marketParams"]
                         and market_group["marketParams"]["uniswapPositionManager"]
                     ):
-                        market_group["marketParams"]["uniswapPositionManager"] = Web3.to_checksum_address(
+                        market_group["marketParams"]["uniswapPositionManager"] = _checksum(
                             market_group["marketParams"]["uniswapPositionManager"]
                         )
 
@@ -220,7 +249,7 @@ class AsyncFoilAPIClient:
 
         try:
             query = gql(query_string)
-            result = await self.client.execute_async(query, variable_values=variables)
+            result = await (await self._get_session()).execute(query, variable_values=variables)
             return result
         except Exception as e:
             self.logger.error(f"Failed to execute GraphQL query: {str(e)}")
@@ -1,6 +1,7 @@
 import asyncio
 import logging
 import threading
+import time
 from typing import Any, Dict, Optional, Type, TypeVar
 
 import discord
@@ -9,6 +10,12 @@ from discord.ext import commands
 # Generic BaseConfig type to allow different bot configs
 T = TypeVar("T", bound="BaseConfig")
 
+# Maximum number of pending messages; the oldest are dropped when Discord falls behind
+MAX_QUEUED_MESSAGES = 100
+
+# Default window during which repeats of the same deduplicated message are suppressed
+DEDUPE_WINDOW_SECONDS = 15 * 60
+
 
 class BaseConfig:
     """Interface for configs that provide Discord settings"""
@@ -43,6 +50,7 @@ class DiscordNotifier:
         self.bot_name = bot_name
         self.logger = logging.getLogger(f"{bot_name}.Discord")
         self.config = config
+        self._dedupe_sent_at: Dict[str, float] = {}
 
         # Check if Discord is configured
         self.enabled = bool(getattr(config, "discord_bot_token", None) and getattr(config, "discord_channel_id", None))
@@ -64,7 +72,8 @@ class DiscordNotifier:
             return
 
         self.ready = False
-        self.message_queue = asyncio.Queue()
+        self.message_queue = asyncio.Queue(maxsize=MAX_QUEUED_MESSAGES)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self.channel_cache = {}
 
         # Set up event handlers
@@ -104,6 +113,7 @@ class DiscordNotifier:
             thread = threading.current_thread()
             thread.name = thread_name
             thread._asyncio_loop = loop
+            self._loop = loop
 
             try:
                 loop.run_until_complete(self.bot.start(self.config.discord_bot_token))
@@ -117,6 +127,9 @@ class DiscordNotifier:
 
     def _get_bot_loop(self):
         """Get the event loop where the bot is running"""
+        if self._loop is not None:
+            return self._loop
+
         # Find the thread where the bot is running
         thread_name = f"DiscordBot-{self.bot_name}"
         for thread in threading.enumerate():
@@ -151,8 +164,8 @@ class DiscordNotifier:
                         channel = await self.bot.fetch_channel(channel_id)
                         self.channel_cache[channel_id] = channel
                     except Exception as e:
+                        # The finally block marks the message done
                         self.logger.error(f"Error fetching channel {channel_id}: {str(e)}")
-                        self.message_queue.task_done()
                         continue
 
                 # Send the message
@@ -166,27 +179,78 @@ class DiscordNotifier:
                 # Mark task as done
                 self.message_queue.task_done()
 
-    async def _queue_message(self, message: str, channel_id: Optional[int] = None):
-        """Async method to properly await putting messages in the queue"""
+    def _queue_message(self, message: str, channel_id: Optional[int] = None):
+        """Put a message in the queue, dropping the oldest one if the queue is full"""
+        if self.message_queue.full():
+            self.message_queue.get_nowait()
+            self.message_queue.task_done()
+            self.logger.warning("Discord message queue full, dropped oldest message")
+
         if channel_id:
-            await self.message_queue.put((message, channel_id))
+            self.message_queue.put_nowait((message, channel_id))
         else:
-            await self.message_queue.put(message)
+            self.message_queue.put_nowait(message)
 
     def send_message(self, message: str, channel_id: Optional[int] = None):
-        """Queue a message to be sent to the configured Discord channel"""
+        """
+        Queue a message to be sent to the configured Discord channel.
+
+        Returns immediately; the message is sent from the Discord bot's own thread.
+        """
         if not self.enabled:
             return
 
         try:
-            # Run coroutine in the bot's event loop
+            # Hand the message off to the bot's event loop
             target_channel = channel_id or self.channel_id
             loop = self._get_bot_loop()
 
             if loop and loop.is_running():
-                asyncio.run_coroutine_threadsafe(self._queue_message(message, target_channel), loop)
+                loop.call_soon_threadsafe(self._queue_message, message, target_channel)
             else:
                 self.logger.warning("Could not get bot's event loop, message not sent")
 
         except Exception as e:
             self.logger.error(f"Error queueing Discord message: {str(e)}")
+
+    def flush(self, timeout: float = 10.0):
+        """
+        Wait until queued messages have been sent, e.g. before the process exits
+
+        Messages are sent from a daemon thread, so anything still queued is lost when the process ends.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if not self.enabled:
+            return
+
+        loop = self._get_bot_loop()
+        if not loop or not loop.is_running():
+            return
+
+        # Scheduled after any messages handed off so far, so the join waits for them too
+        future = asyncio.run_coroutine_threadsafe(self.message_queue.join(), loop)
+        try:
+            future.result(timeout)
+        except Exception:
+            future.cancel()
+            self.logger.warning(f"Timed out after {timeout}s waiting for queued Discord messages")
+
+    def send_deduplicated(self, key: str, message: str, window: float = DEDUPE_WINDOW_SECONDS):
+        """
+        Queue a message unless one with the same key was sent within the window
+
+        Args:
+            key: Identifies repeats of the same message, e.g. the error text
+            message: The message to send
+            window: Seconds during which repeats are suppressed
+        """
+        now = time.monotonic()
+        last_sent = self._dedupe_sent_at.get(key)
+        if last_sent is not None and now - last_sent < window:
+            self.logger.debug("Suppressing repeated Discord message: %s", key)
+            return
+
+        self._dedupe_sent_at[key] = now
+        self.send_message(message)
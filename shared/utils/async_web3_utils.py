@@ -2,25 +2,38 @@
 Async Web3 utilities for interacting with the blockchain
 """
 
+import asyncio
 import logging
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Optional, Tuple, TypedDict, Union
-
-from web3 import Web3
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypedDict, Union
+
+import aiohttp
+from eth_utils.abi import collapse_if_tuple
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
+from web3._utils.abi import map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract import Contract
 from web3.eth import AsyncEth
 from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.net import AsyncNet
 from web3.providers.async_base import AsyncBaseProvider
 from web3.providers.async_rpc import AsyncHTTPProvider
-from web3.types import TxReceipt, Wei
+from web3.types import RPCEndpoint, RPCResponse, TxReceipt, Wei
+
+from shared.abis import MULTICALL3_ABI, MULTICALL3_ADDRESS
+from shared.utils.json_rpc import OrjsonAsyncHTTPProvider, orjson
 
 
 class TransactionConfig(TypedDict, total=False):
     from_address: str
+    gas_limit: int
     gas_limit_multiplier: float
     nonce: Optional[int]
     max_fee_per_gas_multiplier: float
     priority_fee_multiplier: float
+    min_priority_fee: int
     value: Wei
     custom_transaction_params: Dict[str, Any]
 
@@ -33,8 +46,9 @@ def price_to_tick(price: Union[float, Decimal], tick_spacing: int) -> int:
     return tick
 
 
+@lru_cache(maxsize=8192)
 def tick_to_sqrt_price_x96(tick: int) -> int:
-    """Convert a tick to its corresponding sqrtPriceX96 value"""
+    """Convert a tick to its corresponding sqrtPriceX96 value, memoized since ticks repeat on the spacing grid"""
     import math
 
     # Based on the UniswapV3 math for tick to sqrtPriceX96
@@ -48,23 +62,38 @@ def tick_to_sqrt_price_x96(tick: int) -> int:
     return sqrt_price_x96
 
 
-async def create_async_web3_provider(rpc_url: str, logger: logging.Logger) -> Web3:
+# Pooled sessions created by create_async_web3_provider, by Web3 instance, so they can be closed at shutdown
+_pooled_sessions: Dict[int, aiohttp.ClientSession] = {}
+
+
+async def create_async_web3_provider(rpc_url: str, logger: logging.Logger, pool_size: Optional[int] = None) -> Web3:
     """
     Create and initialize an async Web3 provider.
 
     Args:
         rpc_url: RPC URL to connect to
         logger: Logger instance
+        pool_size: Optional maximum number of pooled keep-alive connections to the RPC
 
     Returns:
         Initialized async Web3 instance
     """
     logger.info(f"Connecting to RPC (async): {rpc_url}")
-    # Create an async provider
-    async_provider = AsyncHTTPProvider(rpc_url)
+    # Create an async provider, using orjson for JSON-RPC payloads when available
+    provider_class = OrjsonAsyncHTTPProvider if orjson is not None else AsyncHTTPProvider
+    async_provider = provider_class(rpc_url)
+
+    session = None
+    if pool_size:
+        # Reuse one session with a larger keep-alive pool for every request
+        connector = aiohttp.TCPConnector(limit=pool_size, limit_per_host=pool_size, keepalive_timeout=75)
+        session = aiohttp.ClientSession(connector=connector)
+        await async_provider.cache_async_session(session)
 
     # Create a Web3 instance with async capabilities
     w3 = Web3(async_provider, modules={"eth": (AsyncEth,), "net": (AsyncNet,)})
+    if session is not None:
+        _pooled_sessions[id(w3)] = session
 
     # Check connection
     connected = await w3.is_connected()
@@ -77,6 +106,162 @@ async def create_async_web3_provider(rpc_url: str, logger: logging.Logger) -> We
     return w3
 
 
+async def close_async_web3_provider(w3: Web3) -> None:
+    """
+    Close the pooled session of a Web3 instance from create_async_web3_provider, releasing its connections
+
+    Args:
+        w3: Web3 instance to close
+    """
+    session = _pooled_sessions.pop(id(w3), None)
+    if session is not None:
+        await session.close()
+
+
+def encode_contract_call(contract: Contract, fn_name: str, *args: Any) -> Tuple[str, bytes]:
+    """
+    Encode a contract call for use in a Multicall3 batch.
+
+    Args:
+        contract: Contract instance the call targets
+        fn_name: Name of the contract function
+        *args: Arguments for the contract function
+
+    Returns:
+        Tuple of (target address, calldata)
+    """
+    calldata = contract.encodeABI(fn_name=fn_name, args=list(args))
+    return contract.address, Web3.to_bytes(hexstr=calldata)
+
+
+def get_output_types(contract: Contract, fn_name: str) -> List[str]:
+    """
+    Get the ABI output types of a contract function.
+
+    Args:
+        contract: Contract instance
+        fn_name: Name of the contract function
+
+    Returns:
+        List of output type strings suitable for w3.codec.decode
+    """
+    fn_abi = next(item for item in contract.abi if item.get("type") == "function" and item["name"] == fn_name)
+    return [collapse_if_tuple(output) for output in fn_abi["outputs"]]
+
+
+def decode_contract_result(w3: Web3, contract: Contract, fn_name: str, data: bytes) -> Any:
+    """
+    Decode the return data of a contract call made through Multicall3.
+
+    Args:
+        w3: Web3 instance
+        contract: Contract instance the call targeted
+        fn_name: Name of the contract function
+        data: Raw return data
+
+    Returns:
+        The decoded value, or a tuple when the function has several outputs
+    """
+    output_types = get_output_types(contract, fn_name)
+    # Apply the same normalization as ContractFunction.call(), e.g. checksummed addresses
+    decoded = map_abi_data(BASE_RETURN_NORMALIZERS, output_types, w3.codec.decode(output_types, data))
+    return decoded[0] if len(decoded) == 1 else decoded
+
+
+def decode_static_word(data: bytes, index: int, signed: bool = False) -> int:
+    """
+    Decode one integer field of static ABI return data straight from its 32-byte word.
+
+    Static tuples and structs are encoded inline with one word per field, so single fields can be read
+    without decoding the rest.
+
+    Args:
+        data: Raw return data
+        index: Position of the field in the outputs
+        signed: Whether the field is a signed integer, e.g. an int24 tick
+
+    Returns:
+        The field's integer value
+    """
+    end = (index + 1) * 32
+    if len(data) < end:
+        raise ValueError(f"Return data too short to read word {index}")
+    return int.from_bytes(data[end - 32 : end], "big", signed=signed)
+
+
+async def call_contract_raw(w3: Web3, contract: Contract, fn_name: str, *args: Any) -> bytes:
+    """
+    Call a view function and return its raw return data, leaving decoding to the caller.
+
+    Args:
+        w3: Web3 instance
+        contract: Contract instance to call
+        fn_name: Name of the contract function
+        *args: Arguments for the contract function
+
+    Returns:
+        Raw return data
+    """
+    target, calldata = encode_contract_call(contract, fn_name, *args)
+    return await w3.eth.call({"to": target, "data": calldata})
+
+
+async def multicall_async(
+    w3: Web3, calls: List[Tuple[str, bytes]], allow_failure: bool = False, block_identifier: Optional[Any] = None
+) -> List[Tuple[bool, bytes]]:
+    """
+    Execute several read-only calls in a single eth_call through Multicall3.
+
+    Args:
+        w3: Web3 instance
+        calls: List of (target address, calldata) tuples
+        allow_failure: Whether a reverting call should be returned instead of reverting the batch
+        block_identifier: Block to execute the calls at, defaults to latest
+
+    Returns:
+        List of (success, return data) tuples in the same order as the calls
+    """
+    multicall = w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+    return await multicall.functions.aggregate3([(target, allow_failure, calldata) for target, calldata in calls]).call(
+        block_identifier=block_identifier
+    )
+
+
+class SerializedWebsocketProvider(WebsocketProviderV2):
+    """WebsocketProviderV2 that sends one request at a time over its single connection"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._request_lock = asyncio.Lock()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        async with self._request_lock:
+            return await super().make_request(method, params)
+
+
+async def create_async_websocket_web3_provider(ws_url: str, logger: logging.Logger) -> AsyncWeb3:
+    """
+    Create and connect a persistent WebSocket Web3 provider.
+
+    Requests are serialized over the single connection, so callers may still use asyncio.gather.
+
+    Args:
+        ws_url: WebSocket RPC URL to connect to
+        logger: Logger instance
+
+    Returns:
+        Connected async Web3 instance
+    """
+    logger.info(f"Connecting to RPC (websocket): {ws_url}")
+    w3 = AsyncWeb3.persistent_websocket(SerializedWebsocketProvider(ws_url))
+    await w3.provider.connect()
+
+    chain_id = await w3.eth.chain_id
+    logger.info(f"Connected to network with chain ID: {chain_id}")
+
+    return w3
+
+
 async def estimate_gas(contract_function: Callable, w3: Web3, from_address: str, *args: Any, **kwargs: Any) -> int:
     """
     Estimate the gas required for a contract function call.
@@ -97,7 +282,68 @@ async def estimate_gas(contract_function: Callable, w3: Web3, from_address: str,
     return int(gas_estimate * 1.2)
 
 
-async def send_async_transaction(
+async def _build_transaction_params(
+    w3: Web3,
+    account_address: str,
+    tx_config: TransactionConfig,
+    estimate_gas: Callable[[], Awaitable[int]],
+) -> Dict[str, Any]:
+    """
+    Work out the sender, nonce, gas and fee fields of a transaction.
+
+    Args:
+        w3: Web3 instance
+        account_address: Sender address
+        tx_config: Transaction configuration
+        estimate_gas: Estimates the transaction's gas, skipped when the config gives a gas limit
+
+    Returns:
+        Transaction parameters
+    """
+    gas_limit_multiplier = tx_config.get("gas_limit_multiplier", 1.2)
+    max_fee_multiplier = tx_config.get("max_fee_per_gas_multiplier", 2)
+    priority_fee_multiplier = tx_config.get("priority_fee_multiplier", 1)
+    custom_tx_params = tx_config.get("custom_transaction_params", {})
+
+    # Get latest block for gas calculation
+    latest_block = await w3.eth.get_block("latest")
+    base_fee = latest_block["baseFeePerGas"]
+
+    # Get priority fee, respecting any configured floor
+    priority_fee = max(await w3.eth.max_priority_fee, tx_config.get("min_priority_fee", 0))
+
+    # Calculate max fee
+    max_fee = base_fee + int(priority_fee * max_fee_multiplier)
+
+    # Gas estimation, unless a gas limit is given, e.g. when the call depends on a pending transaction
+    gas_with_buffer = tx_config.get("gas_limit")
+    if gas_with_buffer is None:
+        gas_estimate = await estimate_gas()
+        gas_with_buffer = int(gas_estimate * gas_limit_multiplier)
+
+    # Get nonce - either provided or fetched
+    nonce = tx_config.get("nonce")
+    if nonce is None:
+        nonce = await w3.eth.get_transaction_count(account_address, "pending")
+
+    # Build transaction parameters
+    tx_params = {
+        "from": account_address,
+        "nonce": nonce,
+        "gas": gas_with_buffer,
+        "maxFeePerGas": max_fee,
+        "maxPriorityFeePerGas": int(priority_fee * priority_fee_multiplier),
+        **custom_tx_params,
+    }
+
+    # Add value if specified
+    if "value" in tx_config:
+        tx_params["value"] = tx_config["value"]
+
+    return tx_params
+
+
+async def submit_async_transaction(
     w3: Web3,
     contract_fn: Callable,
     account_address: str,
@@ -106,10 +352,9 @@ async def send_async_transaction(
     tx_description: str,
     *args: Any,
     tx_config: Optional[TransactionConfig] = None,
-    timeout: int = 600,
-) -> TxReceipt:
+) -> HexBytes:
     """
-    Helper function to asynchronously send and wait for a transaction.
+    Helper function to asynchronously build, sign and send a transaction without waiting for it.
 
     Args:
         w3: Web3 instance
@@ -120,64 +365,104 @@ async def send_async_transaction(
         tx_description: Description for logging
         *args: Variable arguments for contract function
         tx_config: Optional transaction configuration
-        timeout: Transaction timeout in seconds
 
     Returns:
-        Transaction receipt
+        Transaction hash
     """
-    if tx_config is None:
-        tx_config = {}
+    try:
+        built_function = contract_fn(*args)
+        tx_params = await _build_transaction_params(
+            w3, account_address, tx_config or {}, lambda: built_function.estimate_gas({"from": account_address})
+        )
 
-    gas_limit_multiplier = tx_config.get("gas_limit_multiplier", 1.2)
-    max_fee_multiplier = tx_config.get("max_fee_per_gas_multiplier", 2)
-    priority_fee_multiplier = tx_config.get("priority_fee_multiplier", 1)
-    custom_tx_params = tx_config.get("custom_transaction_params", {})
+        # Build transaction
+        tx = await built_function.build_transaction(tx_params)
 
-    try:
-        # Get latest block for gas calculation
-        latest_block = await w3.eth.get_block("latest")
-        base_fee = latest_block["baseFeePerGas"]
+        # Sign and send
+        signed_tx = w3.eth.account.sign_transaction(tx, private_key)
+        tx_hash = await w3.eth.send_raw_transaction(signed_tx.rawTransaction)
+        logger.info(f"Sent transaction: {tx_description} (tx: {tx_hash.hex()})")
+        return tx_hash
 
-        # Get priority fee
-        priority_fee = await w3.eth.max_priority_fee
+    except Exception as e:
+        logger.error(f"Error in transaction {tx_description}: {str(e)}")
+        raise
 
-        # Calculate max fee
-        max_fee = base_fee + int(priority_fee * max_fee_multiplier)
 
-        # Gas estimation
-        built_function = contract_fn(*args)
-        gas_estimate = await built_function.estimate_gas({"from": account_address})
-        gas_with_buffer = int(gas_estimate * gas_limit_multiplier)
+async def submit_encoded_transaction(
+    w3: Web3,
+    call: Tuple[str, bytes],
+    account_address: str,
+    private_key: str,
+    logger: logging.Logger,
+    tx_description: str,
+    tx_config: Optional[TransactionConfig] = None,
+) -> HexBytes:
+    """
+    Helper function to asynchronously sign and send a transaction with pre-encoded calldata without waiting for it.
 
-        # Get nonce - either provided or fetched
-        nonce = tx_config.get("nonce")
-        if nonce is None:
-            nonce = await w3.eth.get_transaction_count(account_address, "pending")
+    The calldata is used as is for both gas estimation and the transaction, so it's only ABI-encoded once.
 
-        # Build transaction parameters
-        tx_params = {
-            "from": account_address,
-            "nonce": nonce,
-            "gas": gas_with_buffer,
-            "maxFeePerGas": max_fee,
-            "maxPriorityFeePerGas": int(priority_fee * priority_fee_multiplier),
-            **custom_tx_params,
-        }
+    Args:
+        w3: Web3 instance
+        call: Tuple of (target address, calldata), as returned by encode_contract_call
+        account_address: Sender address
+        private_key: Sender private key
+        logger: Logger instance
+        tx_description: Description for logging
+        tx_config: Optional transaction configuration
 
-        # Add value if specified
-        if "value" in tx_config:
-            tx_params["value"] = tx_config["value"]
+    Returns:
+        Transaction hash
+    """
+    target, calldata = call
 
-        # Build transaction
-        tx = await built_function.build_transaction(tx_params)
+    try:
+        tx_params = await _build_transaction_params(
+            w3,
+            account_address,
+            tx_config or {},
+            lambda: w3.eth.estimate_gas({"from": account_address, "to": target, "data": calldata}),
+        )
+        tx = {**tx_params, "to": target, "data": calldata}
+        if "chainId" not in tx:
+            tx["chainId"] = await w3.eth.chain_id
 
         # Sign and send
         signed_tx = w3.eth.account.sign_transaction(tx, private_key)
         tx_hash = await w3.eth.send_raw_transaction(signed_tx.rawTransaction)
         logger.info(f"Sent transaction: {tx_description} (tx: {tx_hash.hex()})")
+        return tx_hash
 
-        # Wait for receipt
-        receipt = await w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+    except Exception as e:
+        logger.error(f"Error in transaction {tx_description}: {str(e)}")
+        raise
+
+
+async def wait_for_async_transaction(
+    w3: Web3,
+    tx_hash: HexBytes,
+    logger: logging.Logger,
+    tx_description: str,
+    timeout: int = 600,
+    poll_latency: float = 0.1,
+) -> TxReceipt:
+    """
+    Helper function to asynchronously wait for a sent transaction and check that it succeeded.
+
+    Args:
+        w3: Web3 instance
+        tx_hash: Hash of the sent transaction
+        logger: Logger instance
+        tx_description: Description for logging
+        timeout: Transaction timeout in seconds
+        poll_latency: Time between receipt checks in seconds
+
+    Returns:
+        Transaction receipt
+    """
+    try:
+        receipt = await w3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout, poll_latency=poll_latency)
         if receipt["status"] != 1:
             raise ValueError(f"Transaction failed: {tx_description}")
 
@@ -192,6 +477,42 @@ async def send_async_transaction(
         raise
 
 
+async def send_async_transaction(
+    w3: Web3,
+    contract_fn: Callable,
+    account_address: str,
+    private_key: str,
+    logger: logging.Logger,
+    tx_description: str,
+    *args: Any,
+    tx_config: Optional[TransactionConfig] = None,
+    timeout: int = 600,
+    poll_latency: float = 0.1,
+) -> TxReceipt:
+    """
+    Helper function to asynchronously send and wait for a transaction.
+
+    Args:
+        w3: Web3 instance
+        contract_fn: Contract function to call
+        account_address: Sender address
+        private_key: Sender private key
+        logger: Logger instance
+        tx_description: Description for logging
+        *args: Variable arguments for contract function
+        tx_config: Optional transaction configuration
+        timeout: Transaction timeout in seconds
+        poll_latency: Time between receipt checks in seconds
+
+    Returns:
+        Transaction receipt
+    """
+    tx_hash = await submit_async_transaction(
+        w3, contract_fn, account_address, private_key, logger, tx_description, *args, tx_config=tx_config
+    )
+    return await wait_for_async_transaction(w3, tx_hash, logger, tx_description, timeout, poll_latency)
+
+
 async def simulate_async_transaction(
     w3: Web3, contract_fn: Callable, account_address: str, logger: logging.Logger, *args: Any, **kwargs: Any
 ) -> Dict[str, Any]:
@@ -0,0 +1,52 @@
+"""
+JSON-RPC providers that use orjson for request/response (de)serialization when it is installed
+"""
+
+from typing import Any
+
+from web3 import Web3
+from web3.providers.async_rpc import AsyncHTTPProvider
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Serialize the web3 types orjson doesn't handle natively"""
+    if isinstance(obj, (bytes, bytearray)):
+        return Web3.to_hex(obj)
+    if hasattr(obj, "keys"):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonRPCMixin:
+    """Replaces the stdlib json encode/decode of a web3 JSON-RPC provider with orjson"""
+
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+        try:
+            return orjson.dumps(rpc_dict, default=_orjson_default)
+        except TypeError:
+            # Fall back to web3's encoder for anything orjson can't serialize
+            return super().encode_rpc_request(method, params)
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        return orjson.loads(raw_response)
+
+
+class OrjsonHTTPProvider(OrjsonRPCMixin, HTTPProvider):
+    """HTTPProvider using orjson"""
+
+
+class OrjsonAsyncHTTPProvider(OrjsonRPCMixin, AsyncHTTPProvider):
+    """AsyncHTTPProvider using orjson"""
@@ -1,21 +1,65 @@
+import asyncio
 import logging
 import re
-from typing import Optional
+from typing import Dict, Optional
 
 try:
     import openai
 except ImportError:
     openai = None
 
+PREDICTION_MODEL = "gpt-4o-mini"  # Use the cheaper model for this task
+PREDICTION_SYSTEM_PROMPT = (
+    "You are an expert analyst providing likelihood estimates for prediction markets. "
+    "Always respond with just a number between 0-100 representing the percentage likelihood."
+)
+
+# Shared OpenAI clients by API key, so all callers reuse one connection pool
+_clients: Dict[str, "openai.OpenAI"] = {}
+_async_clients: Dict[str, "openai.AsyncOpenAI"] = {}
+
+
+def get_openai_client(api_key: str) -> "openai.OpenAI":
+    """
+    Get or create the shared OpenAI client for an API key
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        OpenAI client whose HTTP connections are kept alive and reused across callers
+    """
+    if not openai:
+        raise ImportError("openai package not installed. Run: pip install openai")
+
+    if api_key not in _clients:
+        _clients[api_key] = openai.OpenAI(api_key=api_key)
+    return _clients[api_key]
+
+
+def get_async_openai_client(api_key: str) -> "openai.AsyncOpenAI":
+    """
+    Get or create the shared AsyncOpenAI client for an API key
+
+    Args:
+        api_key: OpenAI API key
+
+    Returns:
+        AsyncOpenAI client whose HTTP connections are kept alive and reused across callers
+    """
+    if not openai:
+        raise ImportError("openai package not installed. Run: pip install openai")
+
+    if api_key not in _async_clients:
+        _async_clients[api_key] = openai.AsyncOpenAI(api_key=api_key)
+    return _async_clients[api_key]
+
 
 class OpenAIPredictor:
     """Utility for getting prediction market likelihood estimates from OpenAI"""
 
     def __init__(self, api_key: str):
-        if not openai:
-            raise ImportError("openai package not installed. Run: pip install openai")
-
-        self.client = openai.OpenAI(api_key=api_key)
+        self.client = get_openai_client(api_key)
         self.logger = logging.getLogger("OpenAIPredictor")
 
     def get_prediction_likelihood(self, claim_statement: str) -> Optional[float]:
@@ -32,12 +76,9 @@ class OpenAIPredictor:
             prompt = self._build_prediction_prompt(claim_statement)
 
             response = self.client.chat.completions.create(
-                model="gpt-4o-mini",  # Use the cheaper model for this task
+                model=PREDICTION_MODEL,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert analyst providing likelihood estimates for prediction markets. Always respond with just a number between 0-100 representing the percentage likelihood.",
-                    },
+                    {"role": "system", "content": PREDICTION_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt},
                 ],
                 max_tokens=50,
@@ -104,3 +145,81 @@ Your response:"""
                     return max(percentage, 0.0)
         except ValueError:
             return None
+
+
+class AsyncOpenAIPredictor(OpenAIPredictor):
+    """
+    Async variant of OpenAIPredictor that runs predictions concurrently.
+
+    Results are memoized by claim statement, so markets sharing a question only hit the API once.
+    """
+
+    def __init__(self, api_key: str, max_concurrency: int = 5, max_retries: int = 5):
+        if not openai:
+            raise ImportError("openai package not installed. Run: pip install openai")
+
+        # The SDK retries rate limits and transient errors with exponential backoff.
+        # with_options() keeps the shared client's HTTP connection pool.
+        self.client = get_async_openai_client(api_key).with_options(max_retries=max_retries)
+        self.logger = logging.getLogger("OpenAIPredictor")
+        self.max_concurrency = max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._cache: Dict[str, float] = {}
+
+    async def get_prediction_likelihood(self, claim_statement: str) -> Optional[float]:
+        """
+        Get likelihood percentage (0-100) that a claim statement will resolve to 1
+
+        Args:
+            claim_statement: The prediction market claim statement
+
+        Returns:
+            Float between 0-100 representing likelihood percentage, or None if failed
+        """
+        if claim_statement in self._cache:
+            return self._cache[claim_statement]
+
+        # Created lazily so it binds to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            prompt = self._build_prediction_prompt(claim_statement)
+
+            async with self._semaphore:
+                response = await self.client.chat.completions.create(
+                    model=PREDICTION_MODEL,
+                    messages=[
+                        {"role": "system", "content": PREDICTION_SYSTEM_PROMPT},
+                        {"role": "user", "content": prompt},
+                    ],
+                    max_tokens=50,
+                    temperature=0.1,  # Low temperature for more consistent responses
+                )
+
+            # Extract percentage from response
+            response_text = response.choices[0].message.content.strip()
+            percentage = self._extract_percentage(response_text)
+
+            if percentage is not None:
+                self.logger.info(f"Prediction for '{claim_statement[:50]}...': {percentage}%")
+                self._cache[claim_statement] = percentage
+                return percentage
+            else:
+                self.logger.warning(f"Could not extract percentage from response: {response_text}")
+                return None
+
+        except Exception as e:
+            self.logger.error(f"Error getting prediction: {str(e)}")
+            return None
+
+
+# Shared async predictors by API key
+_async_predictors: Dict[str, AsyncOpenAIPredictor] = {}
+
+
+def get_async_predictor(api_key: str) -> AsyncOpenAIPredictor:
+    """Get or create the shared async predictor for an API key"""
+    if api_key not in _async_predictors:
+        _async_predictors[api_key] = AsyncOpenAIPredictor(api_key)
+    return _async_predictors[api_key]
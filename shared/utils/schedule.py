@@ -0,0 +1,69 @@
+"""
+Scheduling helpers for bots that run on a fixed interval
+"""
+
+import asyncio
+import logging
+import random
+import time
+
+import aiohttp
+import requests
+
+# Errors that usually clear up quickly (RPC/API connectivity) and are retried sooner
+TRANSIENT_ERRORS = (
+    asyncio.TimeoutError,
+    ConnectionError,
+    aiohttp.ClientConnectionError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+TRANSIENT_BACKOFF_BASE_SECONDS = 5
+MAX_BACKOFF_SECONDS = 15 * 60
+
+
+async def sleep_until_next_run(last_run: float, interval: float, logger: logging.Logger) -> float:
+    """
+    Sleep until the next scheduled run so the cadence doesn't drift by each run's duration.
+
+    If the bot has fallen more than one interval behind, missed runs are skipped rather than
+    executed back to back.
+
+    Args:
+        last_run: time.monotonic() deadline of the run that just finished
+        interval: Run interval in seconds
+        logger: Logger instance
+
+    Returns:
+        The monotonic deadline of the next run
+    """
+    next_run = last_run + interval
+    now = time.monotonic()
+
+    if now - next_run > interval:
+        missed = int((now - next_run) // interval)
+        logger.warning("Bot is %.2fs behind schedule, skipping %d missed run(s)", now - next_run, missed)
+        next_run += missed * interval
+
+    await asyncio.sleep(max(0.0, next_run - now))
+    return next_run
+
+
+def retry_backoff(error: Exception, fail_count: int, interval: float) -> float:
+    """
+    Get how long to wait before retrying after a failed run, using exponential backoff with jitter.
+
+    Transient connectivity errors back off from a short base; any other error backs off from the
+    run interval.
+
+    Args:
+        error: The exception that failed the run
+        fail_count: Number of consecutive failed runs before this one
+        interval: Run interval in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    base = TRANSIENT_BACKOFF_BASE_SECONDS if isinstance(error, TRANSIENT_ERRORS) else interval
+    max_delay = max(MAX_BACKOFF_SECONDS, interval)
+    return min(max_delay, base * 2**fail_count) * (0.5 + random.random())
@@ -1,11 +1,16 @@
 import logging
 from decimal import Decimal
-from typing import Any, Callable, Dict, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Union
 
+import requests
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.exceptions import TimeExhausted, TransactionNotFound
 from web3.types import TxReceipt
 
+from shared.utils.json_rpc import OrjsonHTTPProvider, orjson
+
 BASE_CHAIN_ID = 8453
 
 
@@ -22,8 +27,9 @@ def tick_to_price(tick: int) -> Decimal:
     return Decimal(1.0001) ** Decimal(tick)
 
 
+@lru_cache(maxsize=8192)
 def tick_to_sqrt_price_x96(tick: int) -> int:
-    """Convert a Uniswap V3 tick to sqrtPriceX96."""
+    """Convert a Uniswap V3 tick to sqrtPriceX96, memoized since strategies reuse the same tick grid."""
     Q96 = Decimal("2") ** 96
     price = tick_to_price(tick)
     return int(price.sqrt() * Q96)
@@ -176,19 +182,29 @@ def simulate_transaction(
         return {"success": False, "error": str(gas_error), "error_type": "gas_estimation_error"}
 
 
-def create_web3_provider(rpc_url: str, logger: logging.Logger) -> Web3:
+def create_web3_provider(rpc_url: str, logger: logging.Logger, pool_size: Optional[int] = None) -> Web3:
     """
     Create and initialize a Web3 provider
 
     Args:
         rpc_url: RPC URL to connect to
         logger: Logger instance
+        pool_size: Optional maximum number of pooled keep-alive connections to the RPC
 
     Returns:
         Initialized Web3 instance
     """
     logger.info(f"Connecting to RPC: {rpc_url}")
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    session = None
+    if pool_size:
+        # Reuse one session with a larger keep-alive pool for every request
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+    # Use orjson for JSON-RPC payloads when available
+    provider_class = OrjsonHTTPProvider if orjson is not None else Web3.HTTPProvider
+    w3 = Web3(provider_class(rpc_url, session=session))
 
     if not w3.is_connected():
         raise ConnectionError(f"Failed to connect to Web3 provider at {rpc_url}")